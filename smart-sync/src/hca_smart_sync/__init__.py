@@ -1,6 +1,7 @@
 """HCA Smart Sync - Intelligent S3 synchronization for HCA Atlas data."""
 
 from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
 try:
     __version__ = version("hca-smart-sync")
@@ -11,7 +12,18 @@ except PackageNotFoundError:
 __author__ = "HCA Team"
 __email__ = "hca-team@example.com"
 
-from hca_smart_sync.sync_engine import SmartSync
-from hca_smart_sync.config import Config
-
 __all__ = ["SmartSync", "Config", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer importing the sync engine (and boto3) until it is actually used
+    if name == "SmartSync":
+        from hca_smart_sync.sync_engine import SmartSync
+
+        return SmartSync
+    # pydantic-settings is a large share of CLI startup; load it on demand too
+    if name == "Config":
+        from hca_smart_sync.config import Config
+
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,26 @@
 """Checksum calculation utilities for data integrity verification."""
 
 import hashlib
+import json
+import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 1 MiB reads amortize syscalls and let kernel readahead stream large .h5ad files
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Enough for every file of many atlases while keeping the cache file to a few MB
+DEFAULT_MAX_CACHE_ENTRIES = 20_000
 
 
 class ChecksumCalculator:
     """Calculate checksums for files to ensure data integrity."""
     
-    def __init__(self, chunk_size: int = 8192):
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
         """
         Initialize the checksum calculator.
         
@@ -29,10 +41,24 @@ class ChecksumCalculator:
         """
         sha256_hash = hashlib.sha256()
         
+        # Read into one reusable buffer rather than allocating bytes per chunk.
+        # The buffer is per call so a calculator can be shared across threads.
+        # This is the same readinto loop hashlib.file_digest runs (with a fixed
+        # 256 KiB buffer); update() releases the GIL for chunks this size.
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        
         with open(file_path, 'rb') as f:
+            # Hint a front-to-back read so the kernel widens readahead
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            
             # Read file in chunks to handle large files efficiently
-            for chunk in iter(lambda: f.read(self.chunk_size), b""):
-                sha256_hash.update(chunk)
+            while n := f.readinto(buffer):
+                sha256_hash.update(view[:n])
         
         return sha256_hash.hexdigest()
     
@@ -67,3 +93,115 @@ class ChecksumCalculator:
         """
         actual_checksum = self.calculate_sha256(file_path)
         return actual_checksum.lower() == expected_checksum.lower()
+
+
+class ChecksumCache:
+    """Persistent SHA256 cache so unchanged files are not re-hashed between runs.
+    
+    Entries are keyed by absolute path and only trusted while the file's size,
+    mtime and inode are unchanged, the same heuristic rsync uses by default.
+    Entries are kept in least-recently-used order and the oldest are dropped on
+    save once there are more than ``max_entries``.
+    """
+    
+    def __init__(self, cache_path: Path, max_entries: int = DEFAULT_MAX_CACHE_ENTRIES):
+        """
+        Load the cache, starting empty if the file is missing or unreadable.
+        
+        Args:
+            cache_path: JSON file the cache is persisted to
+            max_entries: Most entries kept when saving
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries = entries
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checksum cache at {cache_path}: {e}")
+    
+    @staticmethod
+    def _fingerprint(stat: os.stat_result) -> Dict:
+        """Fields that must match for a cached checksum to be reused."""
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+    
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+        """
+        Return the cached checksum if the file is unchanged since it was stored.
+        
+        Args:
+            file_path: Path to the file
+            stat: Current stat result for the file
+            
+        Returns:
+            Cached SHA256 checksum, or None on a miss
+        """
+        key = str(Path(file_path).absolute())
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict):
+            return None
+        
+        fingerprint = self._fingerprint(stat)
+        if any(entry.get(field) != value for field, value in fingerprint.items()):
+            return None
+        
+        # Move hits to the newest end so files still being synced are not evicted
+        self._entries[key] = self._entries.pop(key)
+        return entry.get("sha256")
+    
+    def set(self, file_path: Path, stat: os.stat_result, sha256: str) -> None:
+        """
+        Record a checksum for the file as it was when ``stat`` was taken.
+        
+        Args:
+            file_path: Path to the file
+            stat: Stat result taken before hashing
+            sha256: SHA256 checksum of the file
+        """
+        key = str(Path(file_path).absolute())
+        self._entries.pop(key, None)
+        self._entries[key] = {**self._fingerprint(stat), "sha256": sha256}
+        self._dirty = True
+    
+    def save(self) -> None:
+        """Write the cache to disk if it changed, replacing the file atomically."""
+        if not self._dirty:
+            return
+        
+        # Dicts keep insertion order, so the least recently used entries come first
+        excess = len(self._entries) - self.max_entries
+        if excess > 0:
+            for key in list(self._entries)[:excess]:
+                del self._entries[key]
+        
+        tmp_path: Optional[str] = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer, so concurrent syncs never interleave
+            with tempfile.NamedTemporaryFile(
+                'w',
+                encoding='utf-8',
+                dir=self.cache_path.parent,
+                prefix=self.cache_path.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            # The cache is an optimization; never fail a sync over it
+            logger.warning(f"Could not save checksum cache to {self.cache_path}: {e}")
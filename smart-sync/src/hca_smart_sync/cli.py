@@ -1,10 +1,9 @@
 """Command-line interface for HCA Smart Sync."""
 
 import os
-import subprocess
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Any, Tuple
+from typing import Optional, Any, Tuple, TYPE_CHECKING
 from typing_extensions import Annotated
 from typing import List, Dict
 
@@ -13,12 +12,14 @@ from rich.console import Console
 from rich.table import Table
 from rich.prompt import Confirm
 
-from hca_smart_sync.config import Config
-from hca_smart_sync.sync_engine import SmartSync
 from hca_smart_sync.config_manager import get_config_path, load_config, save_config
 from hca_smart_sync import __version__
 import yaml
 
+if TYPE_CHECKING:
+    from hca_smart_sync.config import Config
+    from hca_smart_sync.sync_engine import SmartSync
+
 # Create the Typer app instance with proper configuration
 app = typer.Typer(
     name="hca-smart-sync",
@@ -137,8 +138,8 @@ def format_tool(tool: str) -> str:
     """Format tool message with performance context and recommendations."""
     if tool == "s5cmd":
         return "[white]Using s5cmd for best performance[/white]"
-    else:  # aws
-        return "[white]Using AWS CLI for uploads. Install s5cmd for better performance.[/white]"
+    else:  # boto3
+        return "[white]Using boto3 for uploads. Install s5cmd for better performance.[/white]"
 
 # Banner display function
 def _display_banner(local_path: Path, s3_path: str, dry_run: bool = False) -> None:
@@ -189,8 +190,11 @@ def _display_upload_plan(files_to_upload: List[Dict], s3_path: str, dry_run: boo
 
 
 # Configuration helpers
-def _load_and_configure(profile: Optional[str], bucket: Optional[str]) -> Config:
+def _load_and_configure(profile: Optional[str], bucket: Optional[str]) -> "Config":
     """Load configuration and apply overrides."""
+    # Imported here so that --help and config commands don't pay for pydantic-settings
+    from hca_smart_sync.config import Config
+    
     try:
         config = Config()
         if profile:
@@ -202,7 +206,7 @@ def _load_and_configure(profile: Optional[str], bucket: Optional[str]) -> Config
         console.print(error_msg(Messages.CONFIG_LOAD_ERROR.format(error=e)))
         raise typer.Exit(1)
 
-def _validate_configuration(config: Config) -> None:
+def _validate_configuration(config: "Config") -> None:
     """Validate required configuration settings."""
     if not config.s3.bucket_name:
         console.print(error_msg(Messages.BUCKET_NOT_CONFIGURED))
@@ -223,8 +227,11 @@ def _resolve_local_path(local_path: Optional[str]) -> Path:
     else:
         return Path.cwd()
 
-def _initialize_sync_engine(config: Config, profile: Optional[str], console: Console) -> SmartSync:
+def _initialize_sync_engine(config: "Config", profile: Optional[str], console: Console) -> "SmartSync":
     """Initialize the sync engine with AWS profile."""
+    # Imported here so that --help and config commands don't pay for boto3
+    from hca_smart_sync.sync_engine import SmartSync
+    
     # Set AWS profile in environment if provided
     if profile:
         os.environ['AWS_PROFILE'] = profile
@@ -295,35 +302,18 @@ def _parse_sync_arguments(
             console.print(f"  hca-smart-sync sync {user_config.get('atlas')} source-datasets")
         raise typer.Exit(1)
 
-def _check_aws_cli() -> bool:
-    """Check if AWS CLI is installed and accessible."""
-    try:
-        result = subprocess.run(
-            ["aws", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
-
-def _display_aws_cli_installation_help() -> None:
-    """Display helpful AWS CLI installation instructions."""
-    typer.secho("AWS CLI is required but not found on your system.", fg=typer.colors.RED)
+def _display_credentials_help() -> None:
+    """Display guidance for configuring AWS credentials."""
+    typer.secho("AWS credentials not found.", fg=typer.colors.RED)
     
     help_text = """
-Please install AWS CLI v2:
+Configure credentials for the profile you sync with:
 
-macOS:     brew install awscli
-Linux:     sudo apt update && sudo apt install awscli  
-Windows:   winget install Amazon.AWSCLI
+  aws configure --profile your-profile-name
+  # OR: export AWS_PROFILE=your-profile-name
 
-Alternative: https://docs.aws.amazon.com/cli/latest/userguide/getting-started-install.html
-
-After installation, configure your credentials:
-  aws configure
-  # OR: aws configure --profile your-profile-name
+Then pass it with --profile, or save it as the default:
+  hca-smart-sync config init
 """
     typer.echo(help_text)
 
@@ -349,6 +339,7 @@ def sync(
     environment: Annotated[Environment, typer.Option(help="Environment: prod or dev (default: prod)")] = Environment.prod,
     force: Annotated[bool, typer.Option(help="Force upload")] = False,
     local_path: Annotated[Optional[str], typer.Option(help="Local directory to scan (defaults to current directory)")] = None,
+    parallel: Annotated[Optional[int], typer.Option(min=1, help="Files to checksum in parallel (defaults to CPU count, up to 8)")] = None,
 ) -> None:
     """Sync .h5ad files from local directory to S3.
     
@@ -403,6 +394,8 @@ def sync(
     # Load and validate configuration
     config = _load_and_configure(profile, bucket)
     _validate_configuration(config)
+    if parallel is not None:
+        config.checksum_workers = parallel
     
     # Build paths
     s3_path = _build_s3_path(config.s3.bucket_name, atlas, file_type.value)
@@ -411,26 +404,20 @@ def sync(
     # Display banner
     _display_banner(current_dir, s3_path, dry_run)
     
-    # Step 1: Check AWS CLI dependency
-    _display_step(1, "Checking AWS CLI dependency")
-    if not _check_aws_cli():
-        _display_aws_cli_installation_help()
-        raise typer.Exit(1)
-    
-    # Step 2: Validate S3 access
-    _display_step(2, "Validating S3 access")
+    # Step 1: Validate S3 access
+    _display_step(1, "Validating S3 access")
     
     # Initialize sync engine and perform sync
     try:
         sync_engine = _initialize_sync_engine(config, profile, console)
         
-        # Step 3: Determine upload tool
-        _display_step(3, "Determining upload tool")
+        # Step 2: Determine upload tool
+        _display_step(2, "Determining upload tool")
         upload_tool = sync_engine._detect_upload_tool()
         console.print(format_tool(upload_tool))
         
-        # Step 4: Scan local files
-        _display_step(4, "Scanning local file system for .h5ad files")
+        # Step 3: Scan local files
+        _display_step(3, "Scanning local file system for .h5ad files")
         
         # Perform sync to get upload plan (always get plan first except for dry_run)
         if dry_run:
@@ -454,6 +441,11 @@ def sync(
                 plan_only=True  # Just get the plan
             )
         
+        # Handle missing credentials
+        if result.get('error') == 'no_credentials':
+            _display_credentials_help()
+            raise typer.Exit(1)
+        
         # Handle S3 access errors
         if result.get('error') == 'access_denied':
             console.print("\n[red]S3 access validation failed. Cannot proceed with sync.[/red]")
@@ -476,8 +468,8 @@ def sync(
             console.print("[green]Sync completed successfully[/green]")
             return
         
-        # Step 5: Compare with S3
-        _display_step(5, "Comparing with S3 (using SHA256 checksums and file size)")
+        # Step 4: Compare with S3
+        _display_step(4, "Comparing with S3 (using SHA256 checksums and file size)")
         
         # Display upload plan for all modes
         if 'files_to_upload' in result and result['files_to_upload']:
@@ -494,11 +486,11 @@ def sync(
                     return
                 console.print()  # Add blank line after confirmation
                 
-                # Step 6: Generate manifest
-                _display_step(6, "Generating and saving manifest locally")
+                # Step 5: Generate manifest
+                _display_step(5, "Generating and saving manifest locally")
                 
-                # Step 7: Upload files
-                _display_step(7, "Uploading files")
+                # Step 6: Upload files
+                _display_step(6, "Uploading files")
                 
                 # Upload with the original force setting (preserves normal vs force behavior)
                 result = sync_engine.sync(
@@ -510,9 +502,9 @@ def sync(
                     plan_only=False  # Actually execute the upload
                 )
                 
-                # Step 8: Upload manifest (if files were uploaded)
+                # Step 7: Upload manifest (if files were uploaded)
                 if result.get('files_uploaded', 0) > 0:
-                    _display_step(8, "Uploading manifest to S3")
+                    _display_step(7, "Uploading manifest to S3")
         else:
             # No files to upload - but only show "all up to date" if there are actually files
             local_files = result.get('local_files', [])
@@ -23,7 +23,9 @@ class S3Config(BaseModel):
     bucket_name: Optional[str] = Field(default=None, description="Default S3 bucket name")
     use_transfer_acceleration: bool = Field(default=True, description="Use S3 transfer acceleration")
     multipart_threshold: int = Field(default=64 * 1024 * 1024, description="Multipart upload threshold in bytes")
+    multipart_chunksize: int = Field(default=16 * 1024 * 1024, description="Multipart upload part size in bytes")
     max_concurrency: int = Field(default=10, description="Maximum concurrent uploads")
+    upload_workers: int = Field(default=4, ge=1, description="Files uploaded in parallel (1 uploads serially)")
 
 
 class ManifestConfig(BaseModel):
@@ -45,6 +47,15 @@ class Config(BaseSettings):
     # Tool Configuration
     verbose: bool = Field(default=False, description="Enable verbose logging")
     dry_run: bool = Field(default=False, description="Perform dry run without actual uploads")
+    checksum_workers: int = Field(
+        default_factory=lambda: min(8, os.cpu_count() or 1),
+        ge=1,
+        description="Threads used to checksum local files (1 hashes serially)"
+    )
+    checksum_cache_path: Optional[Path] = Field(
+        default_factory=lambda: Path.home() / ".hca-smart-sync" / "checksums.json",
+        description="File caching checksums of unchanged local files (None disables)"
+    )
     config_dir: Path = Field(
         default_factory=lambda: Path.home() / ".config" / "hca-ingest-tools",
         description="Configuration directory"
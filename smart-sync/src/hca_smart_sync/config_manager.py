@@ -1,5 +1,7 @@
 """User configuration management for HCA Smart-Sync."""
 
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -8,6 +10,10 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed C implementations when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def get_config_path() -> Path:
     """Get the path to the user config file.
@@ -30,12 +36,13 @@ def load_config(config_path: Path) -> Optional[Dict[str, Any]]:
     Raises:
         yaml.YAMLError: If the YAML file is malformed
     """
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         return None
 
     try:
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
     except yaml.YAMLError as e:
         logger.error(f"Failed to parse config file at {config_path}: {e}")
         raise yaml.YAMLError(
@@ -43,11 +50,22 @@ def load_config(config_path: Path) -> Optional[Dict[str, Any]]:
             f"Please check the YAML syntax or delete the file to start fresh."
         ) from e
 
-    # Handle empty file (yaml.safe_load returns None for empty files)
+    # Handle empty file (the YAML loader returns None for empty files)
     if config_data is None:
         return None
 
-    return config_data
+    # Hand out a copy so callers can't mutate the cached entry
+    return copy.deepcopy(config_data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a config file, memoized on its path, mtime and size.
+
+    Any edit to the file changes the key, so stale entries are never served.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 def save_config(config_path: Path, config_data: Dict[str, Any]) -> None:
@@ -61,4 +79,13 @@ def save_config(config_path: Path, config_data: Dict[str, Any]) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(config_path, "w") as f:
-        yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config_data,
+            f,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    # A rewrite within the same mtime tick could otherwise hit a stale entry
+    _load_cached.cache_clear()
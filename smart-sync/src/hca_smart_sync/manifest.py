@@ -1,7 +1,7 @@
 """Manifest generation for HCA data submissions."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -9,6 +9,11 @@ from natsort import natsorted
 from hca_smart_sync.checksum import ChecksumCalculator
 
 
+def _isoformat_utc(moment: datetime) -> str:
+    """Format an aware UTC datetime as ISO 8601 with a trailing ``Z``."""
+    return moment.isoformat().replace("+00:00", "Z")
+
+
 class ManifestGenerator:
     """Generate submission manifests for HCA data uploads."""
     
@@ -21,6 +26,7 @@ class ManifestGenerator:
         files: List[Path],
         metadata: Optional[Dict] = None,
         submitter_info: Optional[Dict] = None,
+        checksums: Optional[Dict[Path, str]] = None,
     ) -> Dict:
         """
         Generate a submission manifest for uploaded files.
@@ -29,13 +35,15 @@ class ManifestGenerator:
             files: List of files that were uploaded
             metadata: Additional metadata to include
             submitter_info: Information about the submitter
+            checksums: SHA256 values already computed for some of the files;
+                files not listed here are hashed
             
         Returns:
             Dictionary containing the manifest data
         """
         manifest = {
             "manifest_version": "1.0",
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": _isoformat_utc(datetime.now(timezone.utc)),
             "submission_id": self._generate_submission_id(),
             "files": [],
             "metadata": metadata or {},
@@ -46,17 +54,24 @@ class ManifestGenerator:
         sorted_files = natsorted(files, key=lambda x: x.name)
         
         # Add file information
+        checksums = checksums or {}
         for file_path in sorted_files:
-            if file_path.exists():
-                file_info = {
-                    "filename": file_path.name,
-                    "size_bytes": file_path.stat().st_size,
-                    "sha256": self.checksum_calculator.calculate_sha256(file_path),
-                    "modified_at": datetime.fromtimestamp(
-                        file_path.stat().st_mtime
-                    ).isoformat() + "Z",
-                }
-                manifest["files"].append(file_info)
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            sha256 = checksums.get(file_path)
+            if sha256 is None:
+                sha256 = self.checksum_calculator.calculate_sha256(file_path)
+            file_info = {
+                "filename": file_path.name,
+                "size_bytes": stat.st_size,
+                "sha256": sha256,
+                "modified_at": _isoformat_utc(
+                    datetime.fromtimestamp(stat.st_mtime_ns / 1e9, tz=timezone.utc)
+                ),
+            }
+            manifest["files"].append(file_info)
         
         return manifest
     
@@ -85,5 +100,5 @@ class ManifestGenerator:
     
     def _generate_submission_id(self) -> str:
         """Generate a unique submission ID."""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         return f"submission_{timestamp}"
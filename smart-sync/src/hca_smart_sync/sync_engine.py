@@ -1,19 +1,54 @@
 """Smart sync engine for HCA data uploads."""
 
+import functools
+import json
 import os
+import re
+import shlex
 import shutil
 import subprocess
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import NoCredentialsError
 from rich.console import Console
 from natsort import natsorted
+from s3transfer.manager import TransferManager
 
 from hca_smart_sync.config import Config
-from hca_smart_sync.checksum import ChecksumCalculator
-from hca_smart_sync.manifest import ManifestGenerator
+from hca_smart_sync.checksum import ChecksumCache, ChecksumCalculator
+from hca_smart_sync.manifest import ManifestGenerator, _isoformat_utc
+
+# Shared botocore settings: a pool large enough for concurrent transfers,
+# adaptive retries so throttled requests back off instead of failing the sync,
+# and TCP keepalive so pooled connections survive long multipart uploads
+CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True
+)
+
+# Concurrent head_object checks; HEAD is latency-bound and fits in the pool above
+HEAD_OBJECT_WORKERS = 32
+
+# s3://bucket[/prefix]; splits on the first slash after the bucket
+S3_URL_RE = re.compile(r"^s3://([^/]*)/?(.*)$", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_session(profile: Optional[str]) -> boto3.Session:
+    """Get a boto3 session for a profile, shared across SmartSync instances.
+    
+    Building a session re-reads ~/.aws/config and re-resolves credentials, so
+    one per profile is kept for the life of the process. Region is applied per
+    client, so it is not part of the key.
+    """
+    return boto3.Session(profile_name=profile)
 
 
 class SmartSync:
@@ -25,21 +60,101 @@ class SmartSync:
         self.console = console or Console()
         self.checksum_calculator = ChecksumCalculator()
         self.manifest_generator = ManifestGenerator()
+        self._checksum_cache: Optional[ChecksumCache] = None
+        self._upload_tool: Optional[str] = None
         
         # AWS clients will be created lazily to use current config
         self._s3_client = None
+        self._transfer_client = None
+        self._transfer_manager: Optional[TransferManager] = None
+        self._client_settings: Optional[Tuple] = None
+    
+    def _current_client_settings(self) -> Tuple:
+        """Config values the AWS clients are built from."""
+        return (
+            self.config.aws.profile,
+            self.config.aws.region,
+            self.config.s3.use_transfer_acceleration,
+        )
     
     @property
     def s3_client(self) -> boto3.client:
         """Get S3 client, creating it lazily with current config."""
         if self._s3_client is None:
-            session = boto3.Session(profile_name=self.config.aws.profile)
-            self._s3_client = session.client('s3', region_name=self.config.aws.region)
+            self._client_settings = self._current_client_settings()
+            session = _get_session(self.config.aws.profile)
+            self._s3_client = session.client(
+                's3',
+                region_name=self.config.aws.region,
+                config=CLIENT_CONFIG
+            )
         return self._s3_client
     
+    @property
+    def transfer_client(self) -> boto3.client:
+        """Get S3 client for uploads, using the accelerate endpoint when enabled.
+        
+        Kept separate from ``s3_client`` so metadata calls such as
+        ``head_object`` stay on the regional endpoint and only the data
+        transfer itself is routed through acceleration.
+        """
+        if self._transfer_client is None:
+            if not self.config.s3.use_transfer_acceleration:
+                return self.s3_client
+            self._client_settings = self._current_client_settings()
+            session = _get_session(self.config.aws.profile)
+            self._transfer_client = session.client(
+                's3',
+                region_name=self.config.aws.region,
+                config=CLIENT_CONFIG.merge(BotoConfig(s3={"use_accelerate_endpoint": True}))
+            )
+        return self._transfer_client
+    
+    @property
+    def transfer_manager(self) -> TransferManager:
+        """Get the transfer manager shared by every boto3 upload in this sync.
+        
+        One manager means one part-upload thread pool: concurrent files share
+        ``max_concurrency`` workers instead of each upload_file call spinning
+        up and tearing down its own pool.
+        """
+        if self._transfer_manager is None:
+            self._transfer_manager = create_transfer_manager(
+                self.transfer_client,
+                TransferConfig(
+                    multipart_threshold=self.config.s3.multipart_threshold,
+                    multipart_chunksize=self.config.s3.multipart_chunksize,
+                    max_concurrency=self.config.s3.max_concurrency
+                )
+            )
+        return self._transfer_manager
+    
+    @property
+    def checksum_cache(self) -> Optional[ChecksumCache]:
+        """Get the persistent checksum cache, loading it on first use."""
+        if self._checksum_cache is None and self.config.checksum_cache_path is not None:
+            self._checksum_cache = ChecksumCache(self.config.checksum_cache_path)
+        return self._checksum_cache
+    
     def _reset_aws_clients(self) -> None:
-        """Reset AWS clients to pick up config changes."""
+        """Reset AWS clients to pick up config changes.
+        
+        The transfer manager is always rebuilt so it picks up the current
+        multipart and concurrency settings. Clients built from the current
+        profile, region and acceleration settings are kept, so their open
+        connections survive the reset; credentials on the shared session
+        refresh on their own.
+        """
+        if self._transfer_manager is not None:
+            self._transfer_manager.shutdown()
+        self._transfer_manager = None
+        
+        if self._client_settings == self._current_client_settings():
+            return
+        
         self._s3_client = None
+        self._transfer_client = None
+        self._client_settings = None
     
     def sync(
         self,
@@ -65,14 +180,29 @@ class SmartSync:
             Dictionary with sync results
         """
         # Step 0: Validate S3 access before proceeding
-        if not self._validate_s3_access(s3_path):
+        try:
+            has_access = self._validate_s3_access(s3_path)
+        except NoCredentialsError:
+            return {"files_uploaded": 0, "manifest_path": None, "error": "no_credentials"}
+        if not has_access:
             return {"files_uploaded": 0, "manifest_path": None, "error": "access_denied"}
         
-        # Scan for .h5ad files in current directory
-        local_files = self._scan_local_files(local_path)
+        # List the destination while hashing: the listing is network-bound and
+        # the scan is disk/CPU-bound, so neither has to wait for the other
+        remote_files = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            listing = None if force else executor.submit(self._list_remote_files, s3_path)
+            
+            # Scan for .h5ad files in current directory; a forced sync rehashes
+            # everything so its source-sha256 metadata never comes from the cache
+            local_files = self._scan_local_files(local_path, use_cache=not force)
+            
+            # With nothing local the listing (and any error from it) is moot
+            if listing is not None and local_files:
+                remote_files = listing.result()
         
         # Compare with S3 to determine what needs uploading
-        files_to_upload = self._compare_with_s3(local_files, s3_path, force)
+        files_to_upload = self._compare_with_s3(local_files, s3_path, force, remote_files=remote_files)
         
         if not local_files:
             return {"files_uploaded": 0, "files_to_upload": [], "manifest_path": None, "no_files_found": True}
@@ -86,8 +216,7 @@ class SmartSync:
                 "all_up_to_date": True  # Flag to indicate files exist but are up-to-date
             }
         
-        # Sort files using natural sorting for consistent ordering throughout workflow
-        files_to_upload = natsorted(files_to_upload, key=lambda x: x['filename'])
+        # Already in natural order: the scan sorts and the comparison preserves it
         
         # For dry run, return early with the plan
         if dry_run:
@@ -116,10 +245,7 @@ class SmartSync:
         # Step 5: Upload files using the unified upload method
         uploaded_files = []
         if not dry_run:
-            for file_info in files_to_upload:
-                s3_url = self._build_s3_url(file_info, s3_path)
-                if self._upload_file(str(file_info['local_path']), s3_url, include_checksum=True, file_size=file_info['size']):
-                    uploaded_files.append(file_info)
+            uploaded_files = self._upload_files(files_to_upload, s3_path)
         else:
             uploaded_files = files_to_upload  # For dry run reporting
         
@@ -134,173 +260,408 @@ class SmartSync:
             "files": [f["local_path"].name for f in uploaded_files]
         }
     
-    def _scan_local_files(self, local_path: Path) -> List[Dict]:
-        """Scan for .h5ad files in the local directory."""
-        local_files = []
-        
-        for file_path in local_path.glob("*.h5ad"):
-            if file_path.is_file():
-                # Calculate checksum
-                checksum = self.checksum_calculator.calculate_sha256(file_path)
-                
-                local_files.append({
-                    "local_path": file_path,
-                    "filename": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "checksum": checksum,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime)
-                })
-        
-        return local_files
+    def _scan_local_files(self, local_path: Path, use_cache: bool = True) -> List[Dict]:
+        """Scan for .h5ad files in the local directory.
+        
+        Args:
+            local_path: Directory to scan
+            use_cache: Reuse cached checksums for unchanged files; fresh
+                checksums are written back to the cache either way
+            
+        Returns:
+            File records in natural filename order
+        """
+        candidates = []
+        
+        # os.scandir caches stat() on each DirEntry, saving a syscall per attribute
+        with os.scandir(local_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".h5ad") and entry.is_file():
+                    candidates.append((Path(entry.path), entry.stat()))
+        
+        # Files unchanged since a previous run reuse their cached checksum
+        cache = self.checksum_cache
+        checksums = {}
+        if cache is not None and use_cache:
+            for file_path, stat in candidates:
+                cached = cache.get(file_path, stat)
+                if cached is not None:
+                    checksums[file_path] = cached
+        
+        # Hashing releases the GIL, so files are checksummed concurrently
+        paths = [file_path for file_path, _ in candidates if file_path not in checksums]
+        workers = min(self.config.checksum_workers, len(paths)) or 1
+        if workers == 1:
+            hashed = [self.checksum_calculator.calculate_sha256(p) for p in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashed = list(executor.map(self.checksum_calculator.calculate_sha256, paths))
+        checksums.update(zip(paths, hashed))
+        
+        if cache is not None and paths:
+            stats = dict(candidates)
+            for file_path, checksum in zip(paths, hashed):
+                cache.set(file_path, stats[file_path], checksum)
+            cache.save()
+        
+        local_files = [
+            {
+                "local_path": file_path,
+                "filename": file_path.name,
+                "size": stat.st_size,
+                "checksum": checksums[file_path],
+                "mtime_ns": stat.st_mtime_ns
+            }
+            for file_path, stat in candidates
+        ]
+        
+        # scandir order is arbitrary; keep results stable for callers
+        return natsorted(local_files, key=lambda x: x['filename'])
+    
+    def _scan_remote_files(self, s3_path: str) -> Dict[str, Dict]:
+        """List objects directly under an S3 prefix, keyed by filename.
+        
+        Args:
+            s3_path: S3 destination path
+            
+        Returns:
+            Mapping of filename to its key, size, ETag and last-modified time
+        """
+        bucket, prefix = self._parse_s3_path(s3_path)
+        # Same key layout _compare_with_s3 and _build_s3_url use
+        list_prefix = f"{prefix.rstrip('/')}/"
+        
+        remote_files = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=bucket,
+            Prefix=list_prefix,
+            Delimiter='/',
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            for obj in page.get('Contents', []):
+                remote_files[obj['Key'][len(list_prefix):]] = {
+                    "key": obj['Key'],
+                    "size": obj['Size'],
+                    "etag": obj.get('ETag'),
+                    "last_modified": obj.get('LastModified'),
+                }
+        
+        return remote_files
+    
+    def _list_remote_files(self, s3_path: str) -> Dict[str, Dict]:
+        """List the destination prefix, reporting failures as RuntimeError.
+        
+        Args:
+            s3_path: S3 destination path
+            
+        Returns:
+            Mapping of filename to its key, size, ETag and last-modified time
+        """
+        try:
+            return self._scan_remote_files(s3_path)
+        except Exception as e:
+            error = getattr(e, 'response', {}).get('Error', {})
+            raise RuntimeError(
+                f"Failed to list S3 objects under {s3_path}: "
+                f"{error.get('Code', 'Unknown')} - {error.get('Message', str(e))}"
+            ) from e
     
-    def _compare_with_s3(self, local_files: List[Dict], s3_path: str, force: bool) -> List[Dict]:
-        """Compare local files with S3 and determine what needs uploading."""
+    def _compare_with_s3(
+        self,
+        local_files: List[Dict],
+        s3_path: str,
+        force: bool,
+        remote_files: Optional[Dict[str, Dict]] = None
+    ) -> List[Dict]:
+        """Compare local files with S3 and determine what needs uploading.
+        
+        Args:
+            local_files: File records from the local scan
+            s3_path: S3 destination path
+            force: Upload every file regardless of what S3 holds
+            remote_files: Listing from _list_remote_files, if already fetched
+            
+        Returns:
+            File records to upload, each with a "reason"
+        """
+        if force:
+            return [{**local_file, "reason": "forced"} for local_file in local_files]
+        
         files_to_upload = []
         bucket, prefix = self._parse_s3_path(s3_path)
         
+        # One paginated listing settles new and resized files; only objects that
+        # exist at the same size need a head_object for their checksum metadata
+        if remote_files is None:
+            remote_files = self._list_remote_files(s3_path) if local_files else {}
+        
+        reasons: Dict[str, Optional[str]] = {}
+        to_check = []
         for local_file in local_files:
+            remote_file = remote_files.get(local_file['filename'])
+            if remote_file is None:
+                reasons[local_file['filename']] = "new"
+            elif remote_file['size'] != local_file['size']:
+                # Size mismatch catches interrupted or partial uploads
+                reasons[local_file['filename']] = "changed"
+            else:
+                to_check.append(local_file)
+        
+        def check(local_file: Dict) -> Optional[str]:
             s3_key = f"{prefix.rstrip('/')}/{local_file['filename']}"
+            return self._check_remote_checksum(local_file, bucket, s3_key)
+        
+        # The remaining checks are independent round trips, so run them concurrently
+        workers = min(HEAD_OBJECT_WORKERS, len(to_check))
+        if workers <= 1:
+            checked = [check(local_file) for local_file in to_check]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                checked = list(executor.map(check, to_check))
+        reasons.update((f['filename'], reason) for f, reason in zip(to_check, checked))
+        
+        for local_file in local_files:
+            reason = reasons[local_file['filename']]
+            if reason is not None:
+                files_to_upload.append({**local_file, "reason": reason})
+        
+        return files_to_upload
+    
+    def _check_remote_checksum(self, local_file: Dict, bucket: str, s3_key: str) -> Optional[str]:
+        """Compare a listed object's checksum metadata with the local file.
+        
+        Args:
+            local_file: Local file record
+            bucket: S3 bucket name
+            s3_key: Key of the listed object
             
-            if force:
-                files_to_upload.append({**local_file, "reason": "forced"})
-                continue
+        Returns:
+            Upload reason ("new" or "changed"), or None if the object is up to date
+            
+        Raises:
+            RuntimeError: If S3 returns an error other than a missing object
+        """
+        try:
+            # Check if file exists in S3
+            response = self.s3_client.head_object(Bucket=bucket, Key=s3_key)
+            
+            # Compare both checksums and file size to ensure file is complete
+            # This prevents issues with interrupted uploads where metadata is set
+            # but file content is incomplete
+            s3_checksum = response.get('Metadata', {}).get('source-sha256')
+            s3_size = response.get('ContentLength', 0)
+            
+            if (s3_checksum and s3_checksum == local_file['checksum'] and 
+                s3_size == local_file['size']):
+                return None  # File is identical and complete, skip
+            
+            # File exists but has different checksum, size, or missing metadata
+            # This catches interrupted uploads, corrupted files, etc.
+            return "changed"
+            
+        except self.s3_client.exceptions.NoSuchKey:
+            # Object was removed after the listing; upload it as new
+            return "new"
+        except Exception as e:
+            # Handle other ClientError exceptions (like 404)
+            error_code = getattr(e, 'response', {}).get('Error', {}).get('Code', 'Unknown')
+            
+            # If it's a 404 or NoSuchKey, treat as new file
+            if error_code in ['NoSuchKey', '404']:
+                return "new"
+            # For other errors, fail fast rather than assume upload is safe
+            # This prevents issues like access denied, network errors, etc.
+            raise RuntimeError(
+                f"Failed to check S3 status for {local_file['filename']}: "
+                f"{error_code} - {getattr(e, 'response', {}).get('Error', {}).get('Message', str(e))}"
+            ) from e
+    
+    def _upload_files(self, files_to_upload: List[Dict], s3_path: str) -> List[Dict]:
+        """Upload data files, several at a time when going through boto3.
+        
+        Args:
+            files_to_upload: File records from the upload plan
+            s3_path: S3 destination path
+            
+        Returns:
+            The records that uploaded successfully, in plan order
+        """
+        def upload(file_info: Dict) -> bool:
+            return self._upload_file(
+                str(file_info['local_path']),
+                self._build_s3_url(file_info, s3_path),
+                include_checksum=True,
+                file_size=file_info['size'],
+                checksum=file_info['checksum']
+            )
+        
+        # s5cmd fans out internally, so the whole batch goes to one process
+        if files_to_upload and self._detect_upload_tool() == "s5cmd":
+            return self._upload_files_s5cmd(files_to_upload, s3_path)
+        
+        workers = min(self.config.s3.upload_workers, len(files_to_upload))
+        if workers <= 1:
+            results = [upload(file_info) for file_info in files_to_upload]
+        else:
+            # Create the manager up front; the lazy properties aren't thread-safe
+            self.transfer_manager
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(upload, files_to_upload))
+        
+        return [file_info for file_info, ok in zip(files_to_upload, results) if ok]
+    
+    def _upload_files_s5cmd(self, files_to_upload: List[Dict], s3_path: str) -> List[Dict]:
+        """Upload data files with a single ``s5cmd run`` invocation.
+        
+        One process reads every ``cp`` from stdin instead of paying s5cmd's
+        startup per file; its JSON output says which copies succeeded.
+        
+        Args:
+            files_to_upload: File records from the upload plan
+            s3_path: S3 destination path
             
+        Returns:
+            The records that uploaded successfully, in plan order
+        """
+        import time
+        
+        targets = {self._build_s3_url(file_info, s3_path): file_info for file_info in files_to_upload}
+        commands = "".join(
+            shlex.join([
+                "cp",
+                "--metadata", f"source-sha256={file_info['checksum']}",
+                str(file_info['local_path']),
+                s3_url
+            ]) + "\n"
+            for s3_url, file_info in targets.items()
+        )
+        
+        cmd = ["s5cmd", "--json", "--numworkers", "10"]
+        if self.config.s3.use_transfer_acceleration:
+            cmd.extend(["--endpoint-url", "https://s3-accelerate.amazonaws.com"])
+        cmd.append("run")
+        
+        env = os.environ.copy()
+        if self.config.aws.profile:
+            env["AWS_PROFILE"] = self.config.aws.profile
+        
+        # Each file keeps its own time budget; the batch gets their sum
+        upload_timeout = sum(self._calculate_upload_timeout(f['size']) for f in files_to_upload)
+        start_time = time.time()
+        try:
+            result = subprocess.run(
+                cmd,
+                input=commands,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=upload_timeout
+            )
+        except subprocess.TimeoutExpired:
+            self.console.print(f"[red]Upload timeout for s5cmd batch (exceeded {upload_timeout} seconds)[/red]")
+            return []
+        except Exception as e:
+            self.console.print(f"[red]Error uploading with s5cmd: {str(e)}[/red]")
+            return []
+        
+        uploaded = set()
+        for line in result.stdout.splitlines():
             try:
-                # Check if file exists in S3
-                response = self.s3_client.head_object(Bucket=bucket, Key=s3_key)
-                
-                # Compare both checksums and file size to ensure file is complete
-                # This prevents issues with interrupted uploads where metadata is set
-                # but file content is incomplete
-                s3_checksum = response.get('Metadata', {}).get('source-sha256')
-                s3_size = response.get('ContentLength', 0)
-                
-                if (s3_checksum and s3_checksum == local_file['checksum'] and 
-                    s3_size == local_file['size']):
-                    continue  # File is identical and complete, skip
-                
-                # File exists but has different checksum, size, or missing metadata
-                # This catches interrupted uploads, corrupted files, etc.
-                files_to_upload.append({**local_file, "reason": "changed"})
-                
-            except self.s3_client.exceptions.NoSuchKey:
-                # File doesn't exist in S3 - this is normal for new files
-                files_to_upload.append({**local_file, "reason": "new"})
-            except Exception as e:
-                # Handle other ClientError exceptions (like 404)
-                error_code = getattr(e, 'response', {}).get('Error', {}).get('Code', 'Unknown')
-                
-                # If it's a 404 or NoSuchKey, treat as new file
-                if error_code in ['NoSuchKey', '404']:
-                    files_to_upload.append({**local_file, "reason": "new"})
-                else:
-                    # For other errors, fail fast rather than assume upload is safe
-                    # This prevents issues like access denied, network errors, etc.
-                    raise RuntimeError(
-                        f"Failed to check S3 status for {local_file['filename']}: "
-                        f"{error_code} - {getattr(e, 'response', {}).get('Error', {}).get('Message', str(e))}"
-                    ) from e
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and event.get("success") and event.get("destination") in targets:
+                uploaded.add(event["destination"])
         
-        return files_to_upload
+        if result.returncode != 0 or len(uploaded) < len(targets):
+            self.console.print(f"[red]s5cmd upload failed: {result.stderr.strip()}[/red]")
+        
+        for s3_url, file_info in targets.items():
+            if s3_url in uploaded:
+                self._report_upload_success(file_info['filename'], file_info['size'], start_time)
+        
+        return [file_info for s3_url, file_info in targets.items() if s3_url in uploaded]
     
-    def _upload_file(self, local_path: str, s3_url: str, include_checksum: bool = True, file_size: Optional[int] = None) -> bool:
-        """Upload a single file using the best available tool.
+    def _upload_file(
+        self,
+        local_path: str,
+        s3_url: str,
+        include_checksum: bool = True,
+        file_size: Optional[int] = None,
+        checksum: Optional[str] = None
+    ) -> bool:
+        """Upload a single file through boto3's transfer manager.
+        
+        s5cmd uploads are batched by _upload_files_s5cmd and never come here.
         
         Args:
             local_path: Local file path
             s3_url: S3 destination URL
             include_checksum: Whether to include source-sha256 metadata (for data files)
-            file_size: Optional file size for timeout calculation
+            file_size: Optional file size for upload reporting
+            checksum: Precomputed SHA256 from the scan; calculated here if omitted
             
         Returns:
             bool: True if upload successful, False otherwise
         """
-        upload_tool = self._detect_upload_tool()
         local_file = Path(local_path)
-        filename = local_file.name
         
         # Get file size if not provided
         if file_size is None:
             file_size = local_file.stat().st_size
         
-        if upload_tool == "s5cmd":
-            # Build s5cmd command
-            cmd = [
-                "s5cmd",
-                "--numworkers", "10" if include_checksum else "1",  # High concurrency for data files, single for manifests
-            ]
-            
-            # Add transfer acceleration endpoint if enabled
-            if self.config.s3.use_transfer_acceleration:
-                cmd.extend(["--endpoint-url", "https://s3-accelerate.amazonaws.com"])
-            
-            cmd.extend(["cp", "--show-progress"])
-            
-            # Add metadata for data files (not manifests)
-            if include_checksum:
+        metadata: Optional[Dict[str, str]] = None
+        if include_checksum:
+            # Reuse the scan's checksum rather than re-reading the file
+            if checksum is None:
                 checksum = self.checksum_calculator.calculate_sha256(local_file)
-                cmd.extend(["--metadata", f"source-sha256={checksum}"])
-            
-            cmd.extend([str(local_file), s3_url])
-            
-            # Set up environment with AWS profile if specified
-            env = os.environ.copy()
-            if self.config.aws.profile:
-                env["AWS_PROFILE"] = self.config.aws.profile
-            
-            try:
-                import time
-                start_time = time.time()
-                
-                # Calculate upload timeout
-                upload_timeout = self._calculate_upload_timeout(file_size)
-                
-                result = subprocess.run(
-                    cmd,
-                    env=env,
-                    text=True,
-                    timeout=upload_timeout
-                )
-                
-                if result.returncode == 0:
-                    self._report_upload_success(filename, file_size, start_time)
-                    return True
-                else:
-                    # Re-run command to capture error output for reporting
-                    error_result = subprocess.run(
-                        cmd,
-                        env=env,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    self.console.print(f"[red]s5cmd upload failed for {filename}: {error_result.stderr}[/red]")
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                self.console.print(f"[red]Upload timeout for {filename} (exceeded {upload_timeout} seconds)[/red]")
-                return False
-            except Exception as e:
-                self.console.print(f"[red]Error uploading {filename} with s5cmd: {str(e)}[/red]")
-                return False
-        else:
-            # Use AWS CLI
-            import time
-            start_time = time.time()
-            
-            if include_checksum:
-                checksum = self.checksum_calculator.calculate_sha256(Path(local_path))
-                metadata = {"source-sha256": checksum}
-                cmd = self._build_aws_cli_command("cp", local_path, s3_url, metadata)
-            else:
-                cmd = self._build_aws_cli_command("cp", local_path, s3_url)
+            metadata = {"source-sha256": checksum}
+        
+        return self._upload_with_transfer_manager(local_file, s3_url, file_size, metadata)
+    
+    def _upload_with_transfer_manager(
+        self,
+        local_file: Path,
+        s3_url: str,
+        file_size: int,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Upload one file in-process through boto3's transfer manager.
+        
+        Reuses the session's connection pool instead of forking a CLI per file.
+        
+        Args:
+            local_file: Local file path
+            s3_url: S3 destination URL
+            file_size: File size in bytes, for the speed report
+            metadata: Optional user metadata for the object
             
-            try:
-                self._run_aws_cli_command(cmd, f"upload {filename}", file_size)
-                self._report_upload_success(filename, file_size, start_time)
-                return True
-            except Exception:
-                return False
+        Returns:
+            bool: True if upload successful, False otherwise
+        """
+        import time
+        start_time = time.time()
+        
+        bucket, key = self._parse_s3_path(s3_url)
+        extra_args = {"Metadata": metadata} if metadata else None
+        
+        try:
+            future = self.transfer_manager.upload(
+                str(local_file),
+                bucket,
+                key,
+                extra_args=extra_args
+            )
+            future.result()
+        except Exception as e:
+            self.console.print(f"[red]❌ Failed to upload {local_file.name}: {str(e)}[/red]")
+            return False
+        
+        self._report_upload_success(local_file.name, file_size, start_time)
+        return True
 
     def _report_upload_success(self, filename: str, file_size: int, start_time: float) -> None:
         """Report successful upload with speed calculation.
@@ -326,9 +687,11 @@ class SmartSync:
         # Generate manifest
         manifest = self.manifest_generator.generate_manifest(
             files=[f["local_path"] for f in files_to_upload],
+            # The scan already hashed every file; don't read them all again
+            checksums={f["local_path"]: f["checksum"] for f in files_to_upload},
             metadata={
                 "upload_destination": s3_path,
-                "upload_timestamp": datetime.utcnow().isoformat() + "Z",
+                "upload_timestamp": _isoformat_utc(datetime.now(timezone.utc)),
                 "tool": "hca-smart-sync",
                 "version": "0.1.0"
             }
@@ -351,73 +714,42 @@ class SmartSync:
         manifest_prefix = "/".join(prefix.rstrip('/').split('/')[:-1] + ['manifests'])
         manifest_s3_url = f"s3://{bucket}/{manifest_prefix}/{manifest_path.split('/')[-1]}"
         
-        # Use unified upload method without checksum metadata (manifests don't need source-sha256)
-        success = self._upload_file(manifest_path, manifest_s3_url, include_checksum=False)
+        # The manifest is one small JSON file, so it always goes in-process rather
+        # than paying s5cmd's startup; it needs no source-sha256 metadata
+        manifest_file = Path(manifest_path)
+        success = self._upload_with_transfer_manager(manifest_file, manifest_s3_url, manifest_file.stat().st_size)
         if not success:
             raise RuntimeError(f"Failed to upload manifest: {manifest_path}")
     
-    def _parse_s3_path(self, s3_path: str) -> Tuple[str, str]:
-        """Parse S3 path into bucket and prefix."""
-        if not s3_path.startswith("s3://"):
-            raise ValueError("S3 path must start with s3://")
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _parse_s3_path(s3_path: str) -> Tuple[str, str]:
+        """Parse S3 path into bucket and prefix.
         
-        path_parts = s3_path[5:].split("/", 1)
-        bucket = path_parts[0]
-        prefix = path_parts[1] if len(path_parts) > 1 else ""
+        Cached because a sync parses the same destination and per-file URLs
+        repeatedly while comparing, uploading and building manifest keys.
+        """
+        match = S3_URL_RE.match(s3_path)
+        if match is None:
+            raise ValueError("S3 path must start with s3://")
         
+        bucket, prefix = match.groups()
         return bucket, prefix
 
     def _detect_upload_tool(self) -> str:
         """Detect available upload tools and return the best one.
         
         Returns:
-            str: 's5cmd' if available, 'aws' otherwise
-            
-        Raises:
-            RuntimeError: If neither tool is available
+            str: 's5cmd' if available, 'boto3' otherwise; the boto3 transfer
+            manager runs in-process, so the AWS CLI is never required
         """
-        # Check for s5cmd first (preferred for performance)
-        if shutil.which("s5cmd"):
-            return "s5cmd"
+        # Every upload asks, so walk PATH only once per engine
+        if self._upload_tool is None:
+            # Check for s5cmd first (preferred for performance)
+            self._upload_tool = "s5cmd" if shutil.which("s5cmd") else "boto3"
         
-        # Fall back to AWS CLI
-        if shutil.which("aws"):
-            return "aws"
-        
-        # Neither tool available
-        raise RuntimeError("Neither s5cmd nor AWS CLI found. Please install AWS CLI or s5cmd.")
+        return self._upload_tool
 
-    def _build_aws_cli_command(self, operation: str, source: str, destination: str,
-                              metadata: Optional[Dict[str, str]] = None) -> List[str]:
-        """Build AWS CLI command with consistent profile handling.
-        
-        Args:
-            operation: AWS CLI operation (e.g., 'cp', 'sync')
-            source: Source path (local file or S3 URL)
-            destination: Destination path (local file or S3 URL)
-            metadata: Optional metadata dict to add as --metadata key=value pairs
-            
-        Returns:
-            List of command arguments ready for subprocess.run
-        """
-        cmd = ["aws", "s3", operation, source, destination]
-        
-        # Add metadata if provided
-        if metadata:
-            for key, value in metadata.items():
-                cmd.extend(["--metadata", f"{key}={value}"])
-        
-        # Add profile if configured
-        if self.config.aws.profile:
-            cmd.extend(["--profile", self.config.aws.profile])
-        
-        # Add Transfer Acceleration endpoint for faster international uploads
-        # Use accelerated endpoint for all S3 operations
-        if source.startswith('s3://') or destination.startswith('s3://'):
-            cmd.extend(["--endpoint-url", "https://s3-accelerate.amazonaws.com"])
-        
-        return cmd
-    
     def _build_s3_url(self, file_info: Dict, s3_path: str) -> str:
         """Build S3 URL for a file."""
         bucket, prefix = self._parse_s3_path(s3_path)
@@ -441,59 +773,6 @@ class SmartSync:
         # Minimum 30 minutes, maximum 6 hours for very large files
         return max(1800, min(calculated_timeout, 21600))
 
-    def _run_aws_cli_command(self, cmd: List[str], operation_description: str, file_size_bytes: Optional[int] = None) -> None:
-        """Run AWS CLI command with consistent error handling and progress display.
-        
-        Args:
-            cmd: AWS CLI command as list of strings
-            operation_description: Description of the operation for error messages (e.g., "upload file.h5ad")
-            file_size_bytes: Optional file size in bytes for timeout calculation
-        """
-        # Calculate appropriate timeout if file size is provided
-        upload_timeout = None
-        if file_size_bytes is not None:
-            upload_timeout = self._calculate_upload_timeout(file_size_bytes)
-        
-        try:
-            # Let stdout (progress) stream to console; capture stderr for diagnostics.
-            # With check=True we rely on exceptions for error handling; no need to capture the result.
-            subprocess.run(
-                cmd,
-                capture_output=False,  # Let stdout (progress) show naturally
-                stderr=subprocess.PIPE,  # Capture stderr for error handling
-                text=True,
-                timeout=upload_timeout,
-                check=True
-            )
-        except subprocess.TimeoutExpired as e:
-            timeout_msg = f"Upload timeout for {operation_description}"
-            if upload_timeout:
-                timeout_msg += f" (exceeded {upload_timeout} seconds)"
-            self.console.print(f"[red]❌ {timeout_msg}[/red]")
-            raise subprocess.CalledProcessError(1, cmd, stderr=timeout_msg) from e
-        except subprocess.CalledProcessError as e:
-            # Enhance the error with detailed AWS CLI output
-            error_details = [f"Failed to {operation_description}"]
-            
-            if e.stderr:
-                error_details.append(f"AWS CLI Error: {e.stderr.strip()}")
-            
-            error_details.extend([
-                f"Command: {' '.join(cmd)}",
-                f"Exit code: {e.returncode}"
-            ])
-            
-            error_msg = "\n".join(error_details)
-            self.console.print(f"[red]❌ {error_msg}[/red]")
-            
-            # Re-raise the original exception type with enhanced message
-            raise subprocess.CalledProcessError(
-                e.returncode, 
-                e.cmd, 
-                output=e.stdout, 
-                stderr=error_msg  # Enhanced error message in stderr
-            ) from e
-    
     def _validate_s3_access(self, s3_path: str) -> bool:
         """
         Validate that we have proper S3 access before attempting sync.
@@ -503,24 +782,23 @@ class SmartSync:
             
         Returns:
             True if access is valid, False otherwise
+            
+        Raises:
+            NoCredentialsError: If no AWS credentials could be found
         """
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             
-            # Test basic bucket access by listing objects with a limit
-            # This is a lightweight operation that tests both read permissions
-            # and bucket existence
+            # A single prefix-scoped list checks bucket existence and the
+            # ListBucket permission that the head_object comparisons rely on.
+            # head_bucket is not used: it needs bucket-wide ListBucket, which
+            # policies scoped with an s3:prefix condition don't grant.
             self.s3_client.list_objects_v2(
                 Bucket=bucket,
                 Prefix=prefix,
                 MaxKeys=1
             )
             
-            # Test write permissions by attempting to check if we can put an object
-            # We don't actually put anything, just check the permissions
-            # This is done by trying to get the bucket location (requires ListBucket)
-            self.s3_client.get_bucket_location(Bucket=bucket)
-            
             return True
             
         except self.s3_client.exceptions.NoSuchBucket:
@@ -533,5 +811,7 @@ class SmartSync:
                 return False
             else:
                 return False
+        except NoCredentialsError:
+            raise
         except Exception:
             return False
@@ -0,0 +1,23 @@
+"""Shared pytest configuration for the smart-sync test suite."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register opt-in flags for tests that are skipped by default."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow (e.g. ones that shell out to external tools)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow was given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -1,15 +1,19 @@
 """Tests for HCA Smart Sync CLI."""
 
 import contextlib
+import io
 import os
-import pytest
 import subprocess
+import sys
+import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 from typer.testing import CliRunner
+from rich.console import Console
 import click
 import re
 
+from hca_smart_sync.config import Config, AWSConfig, S3Config
 from hca_smart_sync.cli import (
     app, 
     _load_and_configure, 
@@ -18,12 +22,12 @@ from hca_smart_sync.cli import (
     _resolve_local_path, 
     _initialize_sync_engine,
     _parse_sync_arguments,
-    _check_aws_cli,
-    _display_aws_cli_installation_help,
+    _display_credentials_help,
     error_msg,
     success_msg,
     format_file_count,
     format_status,
+    sync as sync_command,
     ATLAS_BIONETWORKS
 )
 
@@ -63,7 +67,6 @@ def mock_sync_dependencies(tmp_path):
         
         # Always mock these CLI internal functions
         patches.extend([
-            patch('hca_smart_sync.cli._check_aws_cli'),
             patch('hca_smart_sync.cli._load_and_configure'),
             patch('hca_smart_sync.cli._validate_configuration'),
             patch('hca_smart_sync.cli._build_s3_path'),
@@ -77,35 +80,88 @@ def mock_sync_dependencies(tmp_path):
             # Build return dict (skip first mock if config_path was mocked)
             offset = 1 if mock_config_path else 0
             yield {
-                'check_aws_cli': mocks[offset],
-                'load_config': mocks[offset + 1],
-                'validate_config': mocks[offset + 2],
-                'build_s3_path': mocks[offset + 3],
-                'resolve_path': mocks[offset + 4],
-                'init_sync': mocks[offset + 5],
+                'load_config': mocks[offset],
+                'validate_config': mocks[offset + 1],
+                'build_s3_path': mocks[offset + 2],
+                'resolve_path': mocks[offset + 3],
+                'init_sync': mocks[offset + 4],
             }
     
     return _mock_deps
 
 
+@pytest.fixture
+def user_config(monkeypatch):
+    """Inject a user config dict into the CLI without a YAML round-trip."""
+    def _set(config_data):
+        monkeypatch.setattr('hca_smart_sync.cli.load_config', lambda path: config_data)
+    return _set
+
+
+@pytest.fixture
+def mock_config():
+    """Spec'd Config mock with the attribute shape used by CLI helpers."""
+    config = Mock(spec=Config)
+    config.aws = Mock(spec=AWSConfig)
+    config.s3 = Mock(spec=S3Config)
+    config.aws.profile = None
+    config.s3.bucket_name = None
+    return config
+
+
+@pytest.fixture
+def mock_config_class(mock_config, monkeypatch):
+    """Config class replaced by a mock that builds ``mock_config``."""
+    config_class = Mock(return_value=mock_config)
+    monkeypatch.setattr('hca_smart_sync.config.Config', config_class)
+    return config_class
+
+
+@pytest.fixture
+def captured_console():
+    """Swap the CLI console for one that renders into an in-memory buffer."""
+    buffer = io.StringIO()
+    with patch('hca_smart_sync.cli.console', Console(file=buffer, width=200)):
+        yield buffer
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared CLI runner; each invoke still gets isolated I/O."""
+    return CliRunner()
+
+
+def _invoke_help(runner, args):
+    """Invoke a help command once and return the result with ANSI-free output."""
+    result = runner.invoke(app, args)
+    return result, strip_ansi(result.stdout or result.output)
+
+
+@pytest.fixture(scope="module")
+def app_help(runner):
+    """Top-level ``--help`` output, rendered once per module."""
+    return _invoke_help(runner, ["--help"])
+
+
+@pytest.fixture(scope="module")
+def sync_help(runner):
+    """``sync --help`` output, rendered once per module."""
+    return _invoke_help(runner, ["sync", "--help"])
+
+
 class TestCLI:
     """Test CLI interface."""
     
-    def setup_method(self):
-        """Set up test runner."""
-        self.runner = CliRunner()
-    
-    def test_cli_help(self):
+    def test_cli_help(self, app_help):
         """Test CLI help command."""
-        result = self.runner.invoke(app, ["--help"])
+        result, out = app_help
         
-        out = strip_ansi(result.stdout or result.output)
         assert result.exit_code == 0
         assert "hca-smart-sync" in out or "Usage:" in out
     
-    def test_cli_version(self):
+    def test_cli_version(self, runner):
         """Test --version flag shows version."""
-        result = self.runner.invoke(app, ["--version"])
+        result = runner.invoke(app, ["--version"])
         
         out = strip_ansi(result.stdout or result.output)
         assert result.exit_code == 0
@@ -113,30 +169,29 @@ class TestCLI:
         # Version should be in format like "0.2.3"
         assert any(char.isdigit() for char in out), "Version output should contain version number"
     
-    def test_sync_command_help(self):
+    @pytest.mark.parametrize("option", ["--dry-run", "--verbose", "--parallel"])
+    def test_sync_command_help(self, sync_help, option):
         """Test sync command help."""
-        result = self.runner.invoke(app, ["sync", "--help"])
+        result, out = sync_help
         
-        out = strip_ansi(result.stdout or result.output)
         assert result.exit_code == 0
-        assert "--dry-run" in out
-        assert "--verbose" in out
+        assert option in out
     
-    def test_sync_command_missing_args(self, tmp_path):
+    def test_sync_command_missing_args(self, runner, tmp_path):
         """Test sync command requires file type when called with no arguments."""
         # Create path to non-existent config
         config_file = tmp_path / "nonexistent.yaml"
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            result = self.runner.invoke(app, ["sync"])
+            result = runner.invoke(app, ["sync"])
             
             # Should fail - file type always required
             assert result.exit_code != 0
-            out = strip_ansi(result.stderr if result.stderr else result.stdout)
+            out = strip_ansi(result.output)
             # Should show helpful error about file type being required
             assert "file type" in out.lower() and "required" in out.lower()
     
-    def test_sync_command_with_invalid_atlas(self):
+    def test_sync_command_with_invalid_atlas(self, runner):
         """Test sync command with invalid atlas name."""
         # Mock AWS/sync engine to prevent real calls
         with patch('hca_smart_sync.cli._initialize_sync_engine') as mock_init:
@@ -145,24 +200,24 @@ class TestCLI:
             mock_init.return_value = mock_sync_engine
             
             # Test with an atlas that would likely fail validation
-            result = self.runner.invoke(app, ["sync", "invalid-atlas-name", "source-datasets", "--dry-run"])
+            result = runner.invoke(app, ["sync", "invalid-atlas-name", "source-datasets", "--dry-run"])
             
             # Should either fail or show some error (depending on validation)
             # This test mainly ensures the command structure works
             assert result.exit_code in [0, 1]  # Either succeeds (dry run) or fails (validation)
     
-    def test_sync_command_with_invalid_environment(self):
+    def test_sync_command_with_invalid_environment(self, runner):
         """Test sync command with invalid environment value."""
         # Test with invalid environment value - should be rejected by Typer enum validation
-        result = self.runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "devv", "--dry-run"])
+        result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "devv", "--dry-run"])
         
         # Should fail due to invalid environment enum value
         assert result.exit_code != 0
-        # Check that error message mentions valid choices (Typer errors go to stderr)
-        error_output = result.stderr if result.stderr else result.stdout
+        # Check that error message mentions valid choices (output includes stderr)
+        error_output = result.output
         assert "is not one of" in error_output or "Invalid value" in error_output
     
-    def test_sync_command_with_valid_environments(self):
+    def test_sync_command_with_valid_environments(self, runner):
         """Test sync command with valid environment values."""
         # Mock AWS/sync engine to prevent real calls
         with patch('hca_smart_sync.cli._initialize_sync_engine') as mock_init:
@@ -178,41 +233,41 @@ class TestCLI:
             # Note: These may still fail later due to AWS access, but enum validation should pass
             
             # Test prod environment
-            result_prod = self.runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "prod", "--dry-run"])
+            result_prod = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "prod", "--dry-run"])
             # Should not fail due to enum validation (may fail later for other reasons)
             # If it fails, it shouldn't be due to invalid enum value
             if result_prod.exit_code != 0:
-                error_output = result_prod.stderr if result_prod.stderr else result_prod.stdout
+                error_output = result_prod.output
                 assert "is not one of" not in error_output
                 assert "Invalid value for '--environment'" not in error_output
             
             # Test dev environment  
-            result_dev = self.runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "dev", "--dry-run"])
+            result_dev = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--environment", "dev", "--dry-run"])
             # Should not fail due to enum validation (may fail later for other reasons)
             if result_dev.exit_code != 0:
-                error_output = result_dev.stderr if result_dev.stderr else result_dev.stdout
+                error_output = result_dev.output
                 assert "is not one of" not in error_output
                 assert "Invalid value for '--environment'" not in error_output
     
-    def test_sync_command_with_invalid_file_type(self):
+    def test_sync_command_with_invalid_file_type(self, runner):
         """Test sync command with invalid file_type value."""
         # Atlas first, then invalid file type
-        result = self.runner.invoke(app, ["sync", "gut-v1", "invalid-file-type", "--dry-run"])
+        result = runner.invoke(app, ["sync", "gut-v1", "invalid-file-type", "--dry-run"])
         
         # Should fail due to invalid file_type value
         assert result.exit_code != 0
         # Check that error message mentions the file types or unrecognized
-        error_output = result.stderr if result.stderr else result.stdout
+        error_output = result.output
         assert "unrecognized" in error_output.lower() or "source-datasets" in error_output.lower()
 
-    def test_sync_command_file_type_first_with_second_arg(self):
+    def test_sync_command_file_type_first_with_second_arg(self, runner):
         """Test sync command fails when file type is first with unexpected second argument."""
         # File type first, then unexpected second arg - should error, not warn
-        result = self.runner.invoke(app, ["sync", "source-datasets", "something-wrong"])
+        result = runner.invoke(app, ["sync", "source-datasets", "something-wrong"])
         
         # Should fail with clear error
         assert result.exit_code == 1
-        error_output = strip_ansi(result.stderr if result.stderr else result.stdout)
+        error_output = strip_ansi(result.output)
         assert "no second argument is allowed" in error_output.lower()
         assert "file_type='source-datasets'" in error_output
         assert "unexpected='something-wrong'" in error_output
@@ -321,56 +376,43 @@ class TestParseSyncArguments:
 class TestHelperFunctions:
     """Test CLI helper functions extracted during refactoring."""
     
-    def test_load_and_configure_basic(self):
+    def test_load_and_configure_basic(self, mock_config, mock_config_class):
         """Test basic configuration loading."""
-        with patch('hca_smart_sync.cli.Config') as mock_config_class:
-            mock_config = Mock()
-            mock_config.aws.profile = None
-            mock_config.s3.bucket_name = None
-            mock_config_class.return_value = mock_config
-            
-            result = _load_and_configure(None, None)
-            
-            assert result == mock_config
-            mock_config_class.assert_called_once()
+        result = _load_and_configure(None, None)
+        
+        assert result == mock_config
+        mock_config_class.assert_called_once()
     
-    def test_load_and_configure_with_overrides(self):
+    def test_load_and_configure_with_overrides(self, mock_config, mock_config_class):
         """Test configuration loading with profile and bucket overrides."""
-        with patch('hca_smart_sync.cli.Config') as mock_config_class:
-            mock_config = Mock()
-            mock_config.aws.profile = None
-            mock_config.s3.bucket_name = None
-            mock_config_class.return_value = mock_config
-            
-            result = _load_and_configure("test-profile", "test-bucket")
-            
-            assert result == mock_config
-            assert mock_config.aws.profile == "test-profile"
-            assert mock_config.s3.bucket_name == "test-bucket"
+        result = _load_and_configure("test-profile", "test-bucket")
+        
+        assert result == mock_config
+        assert mock_config.aws.profile == "test-profile"
+        assert mock_config.s3.bucket_name == "test-bucket"
     
-    def test_load_and_configure_exception(self):
+    def test_load_and_configure_exception(self, mock_config_class, captured_console):
         """Test configuration loading with exception."""
-        with patch('hca_smart_sync.cli.Config') as mock_config_class:
-            mock_config_class.side_effect = Exception("Config error")
-            
-            with pytest.raises(click.exceptions.Exit):
-                _load_and_configure(None, None)
+        mock_config_class.side_effect = Exception("Config error")
+        
+        with pytest.raises(click.exceptions.Exit):
+            _load_and_configure(None, None)
+        
+        assert "Config error" in captured_console.getvalue()
     
-    def test_validate_configuration_valid(self):
+    def test_validate_configuration_valid(self, mock_config):
         """Test configuration validation with valid config."""
-        mock_config = Mock()
         mock_config.s3.bucket_name = "test-bucket"
         
         # Should not raise any exception
         _validate_configuration(mock_config)
     
-    def test_validate_configuration_missing_bucket(self):
+    def test_validate_configuration_missing_bucket(self, mock_config, captured_console):
         """Test configuration validation with missing bucket."""
-        mock_config = Mock()
-        mock_config.s3.bucket_name = None
-        
         with pytest.raises(click.exceptions.Exit):
             _validate_configuration(mock_config)
+        
+        assert "S3 bucket not configured" in captured_console.getvalue()
     
     def test_build_s3_path(self):
         """Test S3 path building."""
@@ -386,12 +428,14 @@ class TestHelperFunctions:
         
         assert result == expected
     
-    def test_build_s3_path_with_unknown_atlas(self):
+    def test_build_s3_path_with_unknown_atlas(self, captured_console):
         """Test S3 path building with unknown atlas."""
         atlas = "gut-v123"
 
         with pytest.raises(click.exceptions.Exit):
             _build_s3_path("test-bucket", atlas, "source-datasets")
+        
+        assert "Unknown atlas: gut-v123" in captured_console.getvalue()
     
     def test_build_s3_path_atlases(self):
         """Test that all atlases in the bionetwork mapping produce a path with a valid bionetwork."""
@@ -433,10 +477,9 @@ class TestHelperFunctions:
         
         assert result == Path.cwd()
     
-    def test_initialize_sync_engine_basic(self):
+    def test_initialize_sync_engine_basic(self, mock_config):
         """Test basic sync engine initialization."""
-        with patch('hca_smart_sync.cli.SmartSync') as mock_sync_class:
-            mock_config = Mock()
+        with patch('hca_smart_sync.sync_engine.SmartSync') as mock_sync_class:
             mock_console = Mock()
             mock_sync_engine = Mock()
             mock_sync_class.return_value = mock_sync_engine
@@ -446,11 +489,10 @@ class TestHelperFunctions:
             assert result == mock_sync_engine
             mock_sync_class.assert_called_once_with(mock_config, console=mock_console)
     
-    def test_initialize_sync_engine_with_profile(self):
+    def test_initialize_sync_engine_with_profile(self, mock_config):
         """Test sync engine initialization with profile override."""
-        with patch('hca_smart_sync.cli.SmartSync') as mock_sync_class, \
+        with patch('hca_smart_sync.sync_engine.SmartSync') as mock_sync_class, \
              patch.dict('os.environ', {}, clear=True):
-            mock_config = Mock()
             mock_console = Mock()
             mock_sync_engine = Mock()
             mock_sync_class.return_value = mock_sync_engine
@@ -462,6 +504,37 @@ class TestHelperFunctions:
             assert os.environ.get('AWS_PROFILE') == "test-profile"
 
 
+class TestLazyImports:
+    """Test that heavy dependencies stay out of CLI startup."""
+    
+    def test_cli_import_does_not_load_boto3(self):
+        """Importing the CLI module should not import boto3, the sync engine or pydantic-settings."""
+        code = (
+            "import sys, hca_smart_sync.cli; "
+            "assert 'boto3' not in sys.modules, 'boto3 imported'; "
+            "assert 'hca_smart_sync.sync_engine' not in sys.modules, 'sync engine imported'; "
+            "assert 'pydantic_settings' not in sys.modules, 'pydantic-settings imported'"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        
+        assert result.returncode == 0, result.stderr
+    
+    def test_package_exposes_smart_sync_lazily(self):
+        """SmartSync is still importable from the package root."""
+        import hca_smart_sync
+        from hca_smart_sync.sync_engine import SmartSync
+        
+        assert hca_smart_sync.SmartSync is SmartSync
+    
+    def test_package_exposes_config_lazily(self):
+        """Config is still importable from the package root."""
+        import hca_smart_sync
+        from hca_smart_sync.config import Config
+        
+        assert hca_smart_sync.Config is Config
+
+
 class TestMessageFormatters:
     """Test message formatting helper functions."""
     
@@ -489,130 +562,71 @@ class TestMessageFormatters:
         assert result == "[green]Sync completed successfully[/green]"
 
 
-class TestCLIArgumentValidation:
-    """Test CLI argument validation and error handling."""
-    
-    # These tests are obsolete since we removed custom error handling in Typer 0.16.0 upgrade
-    # The main() function now just calls app() directly and Typer handles all errors natively
-    pass
-
-
 class TestNoArgsHelp:
     """Test help display when no arguments provided."""
     
-    def setup_method(self):
-        """Set up test runner."""
-        self.runner = CliRunner()
-    
-    def test_no_args_shows_help(self):
+    def test_no_args_shows_help(self, runner):
         """Test that running with no arguments displays help."""
-        result = self.runner.invoke(app, [])
+        result = runner.invoke(app, [])
         
         out = strip_ansi(result.stdout or result.output)
         assert result.exit_code == 0
         assert "Usage:" in out or "hca-smart-sync" in out
         # Should show command descriptions
         assert "sync" in out.lower()
-    
-    def test_help_works_without_aws_cli(self):
-        """Test that --help works even without AWS CLI installed."""
-        with patch('hca_smart_sync.cli._check_aws_cli') as mock_check:
-            mock_check.return_value = False
-            
-            result = self.runner.invoke(app, ["--help"])
-            
-            out = strip_ansi(result.stdout or result.output)
-            assert result.exit_code == 0
-            assert "Usage:" in out or "hca-smart-sync" in out
 
 
-class TestAWSCLIDependencyCheck:
-    """Test AWS CLI dependency checking functionality."""
-    
-    def test_check_aws_cli_available(self):
-        """Test _check_aws_cli when AWS CLI is available."""
-        with patch('subprocess.run') as mock_run:
-            # Mock successful AWS CLI check
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
-            
-            result = _check_aws_cli()
-            
-            assert result is True
-            mock_run.assert_called_once_with(
-                ["aws", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-    
-    def test_check_aws_cli_not_found(self):
-        """Test _check_aws_cli when AWS CLI is not found."""
-        with patch('subprocess.run') as mock_run:
-            # Mock FileNotFoundError (command not found)
-            mock_run.side_effect = FileNotFoundError("aws command not found")
-            
-            result = _check_aws_cli()
-            
-            assert result is False
+CREDENTIALS_HELP_TOKENS = (
+    "AWS credentials not found",
+    "aws configure --profile",
+    "export AWS_PROFILE",
+    "hca-smart-sync config init",
+)
+
+
+class TestCredentialsHelp:
+    """Test guidance shown when no AWS credentials are configured."""
     
-    def test_check_aws_cli_non_zero_exit(self):
-        """Test _check_aws_cli when AWS CLI returns non-zero exit code."""
-        with patch('subprocess.run') as mock_run:
-            # Mock non-zero exit code
-            mock_result = Mock()
-            mock_result.returncode = 1
-            mock_run.return_value = mock_result
-            
-            result = _check_aws_cli()
-            
-            assert result is False
+    def test_display_credentials_help(self, capsys):
+        """Test _display_credentials_help output."""
+        _display_credentials_help()
+        
+        output = capsys.readouterr().out
+        
+        missing = [token for token in CREDENTIALS_HELP_TOKENS if token not in output]
+        assert not missing, f"missing from credentials help: {missing}"
     
-    def test_check_aws_cli_timeout(self):
-        """Test _check_aws_cli when subprocess times out."""
-        with patch('subprocess.run') as mock_run:
-            # Mock timeout
-            mock_run.side_effect = subprocess.TimeoutExpired("aws", 10)
-            
-            result = _check_aws_cli()
+    def test_sync_without_credentials_shows_help(self, runner, mock_sync_dependencies):
+        """Test sync exits with credential guidance when the engine finds no credentials."""
+        with mock_sync_dependencies() as mocks:
+            mock_config = Mock()
+            mock_config.s3.bucket_name = "test-bucket"
+            mocks['load_config'].return_value = mock_config
+            mocks['build_s3_path'].return_value = "s3://test-bucket/gut/gut-v1/source-datasets/"
+            mocks['resolve_path'].return_value = "/test/path"
             
-            assert result is False
-    
-    def test_check_aws_cli_subprocess_error(self):
-        """Test _check_aws_cli with general subprocess error."""
-        with patch('subprocess.run') as mock_run:
-            # Mock general subprocess error
-            mock_run.side_effect = subprocess.SubprocessError("General error")
+            mock_sync_engine = Mock()
+            mock_sync_engine.sync.return_value = {
+                "files_uploaded": 0,
+                "manifest_path": None,
+                "error": "no_credentials"
+            }
+            mocks['init_sync'].return_value = mock_sync_engine
             
-            result = _check_aws_cli()
+            result = runner.invoke(app, ["sync", "gut-v1", "source-datasets"])
             
-            assert result is False
-    
-    def test_display_aws_cli_installation_help(self, capsys):
-        """Test _display_aws_cli_installation_help output."""
-        _display_aws_cli_installation_help()
-        
-        captured = capsys.readouterr()
-        output = captured.out
-        
-        # Check key elements are present
-        assert "AWS CLI is required but not found" in output
-        assert "brew install awscli" in output
-        assert "sudo apt update && sudo apt install awscli" in output
-        assert "winget install Amazon.AWSCLI" in output
-        assert "aws configure" in output
+            assert result.exit_code == 1
+            assert "AWS credentials not found" in strip_ansi(result.output)
 
 
 class TestSyncScenarios:
     """Test sync command scenarios."""
     
-    def test_sync_no_files_found(self, mock_sync_dependencies):
+    def test_sync_no_files_found(self, runner, mock_sync_dependencies):
         """Test sync command when no .h5ad files are found."""
         with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -629,7 +643,6 @@ class TestSyncScenarios:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--profile", "test"])
             
             assert result.exit_code == 0
@@ -637,12 +650,11 @@ class TestSyncScenarios:
             assert "Uploaded 0 file(s)" in result.output
             assert "Sync completed successfully" in result.output
 
-    def test_sync_all_files_up_to_date(self, mock_sync_dependencies):
+    def test_sync_all_files_up_to_date(self, runner, mock_sync_dependencies):
         """Test sync command when files exist but are all up to date."""
         with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -665,7 +677,6 @@ class TestSyncScenarios:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--profile", "test"])
             
             assert result.exit_code == 0
@@ -673,12 +684,11 @@ class TestSyncScenarios:
             assert "Uploaded 0 file(s)" in result.output
             assert "Sync completed successfully" in result.output
 
-    def test_sync_single_file_up_to_date(self, mock_sync_dependencies):
+    def test_sync_single_file_up_to_date(self, runner, mock_sync_dependencies):
         """Test sync command when single file exists but is up to date (singular message)."""
         with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -699,7 +709,6 @@ class TestSyncScenarios:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--profile", "test"])
             
             assert result.exit_code == 0
@@ -707,12 +716,11 @@ class TestSyncScenarios:
             assert "Uploaded 0 file(s)" in result.output
             assert "Sync completed successfully" in result.output
 
-    def test_sync_integrated_objects_file_type(self, mock_sync_dependencies):
+    def test_sync_integrated_objects_file_type(self, runner, mock_sync_dependencies):
         """Test sync command with integrated-objects file type builds correct S3 path."""
         with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mocks['load_config'].return_value = mock_config
             mocks['build_s3_path'].return_value = "s3://test-bucket/gut/gut-v1/integrated-objects/"
@@ -723,7 +731,6 @@ class TestSyncScenarios:
             mock_sync_engine.sync.return_value = {"files_uploaded": 0, "files_to_upload": []}
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             result = runner.invoke(app, ["sync", "gut-v1", "integrated-objects", "--profile", "test"])
             
             # Verify command succeeded
@@ -737,11 +744,26 @@ class TestSyncScenarios:
             # Verify sync engine was actually invoked
             mock_sync_engine.sync.assert_called_once()
 
+    def test_sync_parallel_sets_checksum_workers(self, runner, mock_sync_dependencies):
+        """Test that --parallel is applied to the config the sync engine is built with."""
+        with mock_sync_dependencies() as mocks:
+            mock_config = Mock()
+            mocks['load_config'].return_value = mock_config
+            mocks['build_s3_path'].return_value = "s3://test-bucket/gut/gut-v1/source-datasets/"
+            mocks['resolve_path'].return_value = "/test/path"
+            mocks['init_sync'].return_value.sync.return_value = {"files_uploaded": 0, "files_to_upload": []}
+
+            result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--profile", "test", "--parallel", "3"])
+
+            assert result.exit_code == 0
+            assert mock_config.checksum_workers == 3
+            assert mocks['init_sync'].call_args[0][0] is mock_config
+
 
 class TestConfigShow:
     """Tests for 'config show' command."""
 
-    def test_config_show_with_existing_config(self, tmp_path):
+    def test_config_show_with_existing_config(self, runner, tmp_path):
         """Test config show displays existing configuration."""
         config_file = tmp_path / "config.yaml"
         config_data = {"profile": "my-profile", "atlas": "gut-v1"}
@@ -752,7 +774,6 @@ class TestConfigShow:
         
         # Mock get_config_path to return test file
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             result = runner.invoke(app, ["config", "show"])
             
             # Should succeed
@@ -762,21 +783,20 @@ class TestConfigShow:
             assert "profile: my-profile" in result.output
             assert "atlas: gut-v1" in result.output
             # Path should be in output (may be wrapped)
-            assert config_file.name in result.output
+            assert config_file.name in result.output.replace("\n", "")
 
-    def test_config_show_with_missing_config(self, tmp_path):
+    def test_config_show_with_missing_config(self, runner, tmp_path):
         """Test config show when no config file exists."""
         config_file = tmp_path / "nonexistent.yaml"
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             result = runner.invoke(app, ["config", "show"])
             
             # Should succeed but indicate no config
             assert result.exit_code == 0
             assert "No configuration file found" in result.output or "not found" in result.output.lower()
 
-    def test_config_show_with_partial_config(self, tmp_path):
+    def test_config_show_with_partial_config(self, runner, tmp_path):
         """Test config show with only profile (no atlas)."""
         config_file = tmp_path / "config.yaml"
         config_data = {"profile": "my-profile"}
@@ -785,7 +805,6 @@ class TestConfigShow:
         save_config(config_file, config_data)
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             result = runner.invoke(app, ["config", "show"])
             
             assert result.exit_code == 0
@@ -794,31 +813,29 @@ class TestConfigShow:
             assert "atlas:" in result.output
             assert "not set" in result.output
 
-    def test_config_show_with_malformed_config(self, tmp_path):
+    def test_config_show_with_malformed_config(self, runner, tmp_path):
         """Test config show with malformed YAML file."""
         config_file = tmp_path / "config.yaml"
         with open(config_file, "w") as f:
             f.write("invalid: yaml: content: [")
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             result = runner.invoke(app, ["config", "show"])
             
             # Should fail with error message
             assert result.exit_code == 1
             assert "malformed" in result.output.lower() or "error" in result.output.lower()
-            assert config_file.name in result.output
+            assert config_file.name in result.output.replace("\n", "")
 
 
 class TestConfigInit:
     """Tests for 'config init' command."""
 
-    def test_config_init_create_new(self, tmp_path):
+    def test_config_init_create_new(self, runner, tmp_path):
         """Test config init creates new configuration."""
         config_file = tmp_path / "config.yaml"
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             # Provide interactive input: profile and atlas
             result = runner.invoke(app, ["config", "init"], input="my-profile\ngut-v1\n")
             
@@ -835,7 +852,7 @@ class TestConfigInit:
             assert config_data["profile"] == "my-profile"
             assert config_data["atlas"] == "gut-v1"
 
-    def test_config_init_update_existing(self, tmp_path):
+    def test_config_init_update_existing(self, runner, tmp_path):
         """Test config init updates existing configuration."""
         config_file = tmp_path / "config.yaml"
         
@@ -844,7 +861,6 @@ class TestConfigInit:
         save_config(config_file, {"profile": "old-profile", "atlas": "lung-v2"})
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             # Update both values
             result = runner.invoke(app, ["config", "init"], input="new-profile\nbrain-v1\n")
             
@@ -857,89 +873,43 @@ class TestConfigInit:
             assert config_data["profile"] == "new-profile"
             assert config_data["atlas"] == "brain-v1"
 
-    def test_config_init_keep_existing_values(self, tmp_path):
-        """Test config init keeps values when Enter is pressed."""
-        config_file = tmp_path / "config.yaml"
-        
-        # Create existing config
-        from hca_smart_sync.config_manager import save_config
-        save_config(config_file, {"profile": "keep-profile", "atlas": "retina-v1"})
-        
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
+    @pytest.mark.parametrize(
+        "seed, stdin, expected",
+        [
             # Press Enter twice to keep both values
-            result = runner.invoke(app, ["config", "init"], input="\n\n")
-            
-            assert result.exit_code == 0
-            
-            # Verify values unchanged
-            from hca_smart_sync.config_manager import load_config
-            config_data = load_config(config_file)
-            assert config_data["profile"] == "keep-profile"
-            assert config_data["atlas"] == "retina-v1"
-
-    def test_config_init_partial_update(self, tmp_path):
-        """Test config init updates only one value."""
-        config_file = tmp_path / "config.yaml"
-        
-        # Create existing config
-        from hca_smart_sync.config_manager import save_config
-        save_config(config_file, {"profile": "old-profile", "atlas": "immune-v1"})
-        
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
+            ({"profile": "keep-profile", "atlas": "retina-v1"}, "\n\n",
+             {"profile": "keep-profile", "atlas": "retina-v1"}),
             # Update profile, keep atlas
-            result = runner.invoke(app, ["config", "init"], input="new-profile\n\n")
-            
-            assert result.exit_code == 0
-            
-            # Verify partial update
-            from hca_smart_sync.config_manager import load_config
-            config_data = load_config(config_file)
-            assert config_data["profile"] == "new-profile"
-            assert config_data["atlas"] == "immune-v1"
-
-    def test_config_init_with_only_profile(self, tmp_path):
-        """Test config init with only profile (no atlas)."""
-        config_file = tmp_path / "config.yaml"
-        
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
+            ({"profile": "old-profile", "atlas": "immune-v1"}, "new-profile\n\n",
+             {"profile": "new-profile", "atlas": "immune-v1"}),
             # Provide profile, press Enter for atlas
-            result = runner.invoke(app, ["config", "init"], input="my-profile\n\n")
-            
-            assert result.exit_code == 0
-            
-            # Verify only profile is set
-            from hca_smart_sync.config_manager import load_config
-            config_data = load_config(config_file)
-            assert config_data.get("profile") == "my-profile"
-            # Atlas should either be absent or empty
-            assert not config_data.get("atlas")
-
-    def test_config_init_with_only_atlas(self, tmp_path):
-        """Test config init with only atlas (no profile)."""
+            (None, "my-profile\n\n", {"profile": "my-profile"}),
+            # Press Enter for profile, provide atlas
+            (None, "\ngut-v1\n", {"atlas": "gut-v1"}),
+        ],
+        ids=["keep_existing_values", "partial_update", "only_profile", "only_atlas"],
+    )
+    def test_config_init_prompts(self, runner, tmp_path, seed, stdin, expected):
+        """Test config init keeps, updates, or omits values based on prompt input."""
+        from hca_smart_sync.config_manager import load_config, save_config
+        
         config_file = tmp_path / "config.yaml"
+        if seed is not None:
+            save_config(config_file, seed)
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
-            # Press Enter for profile, provide atlas
-            result = runner.invoke(app, ["config", "init"], input="\ngut-v1\n")
+            result = runner.invoke(app, ["config", "init"], input=stdin)
             
             assert result.exit_code == 0
             
-            # Verify only atlas is set
-            from hca_smart_sync.config_manager import load_config
-            config_data = load_config(config_file)
-            assert not config_data.get("profile")
-            assert config_data.get("atlas") == "gut-v1"
+            # Only non-empty values are persisted
+            assert load_config(config_file) == expected
 
-    def test_config_init_with_invalid_atlas(self, tmp_path):
+    def test_config_init_with_invalid_atlas(self, runner, tmp_path):
         """Test config init errors on invalid atlas."""
         config_file = tmp_path / "config.yaml"
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
             # Provide interactive input: profile and atlas
             result = runner.invoke(app, ["config", "init"], input="my-profile\ngut-v123\n")
             
@@ -953,19 +923,13 @@ class TestConfigInit:
 class TestSyncWithConfigDefaults:
     """Tests for sync command using config file defaults."""
 
-    def test_sync_uses_config_profile(self, tmp_path, mock_sync_dependencies):
+    def test_sync_uses_config_profile(self, runner, user_config, mock_sync_dependencies):
         """Test that sync uses profile from config when not specified."""
-        config_file = tmp_path / "config.yaml"
+        user_config({"profile": "config-profile", "atlas": "gut-v1"})
         
-        # Create config with profile
-        from hca_smart_sync.config_manager import save_config
-        save_config(config_file, {"profile": "config-profile", "atlas": "gut-v1"})
-        
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file), \
-             mock_sync_dependencies(mock_config_path=False) as mocks:
+        with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -981,7 +945,6 @@ class TestSyncWithConfigDefaults:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             # Don't specify --profile, should use config default
             result = runner.invoke(app, ["sync", "gut-v1", "source-datasets"])
             
@@ -990,19 +953,13 @@ class TestSyncWithConfigDefaults:
             mocks['load_config'].assert_called_once()
             assert mocks['load_config'].call_args[0][0] == "config-profile"
 
-    def test_sync_cli_profile_overrides_config(self, tmp_path, mock_sync_dependencies):
+    def test_sync_cli_profile_overrides_config(self, runner, user_config, mock_sync_dependencies):
         """Test that CLI --profile overrides config file."""
-        config_file = tmp_path / "config.yaml"
-        
-        # Create config with profile
-        from hca_smart_sync.config_manager import save_config
-        save_config(config_file, {"profile": "config-profile"})
+        user_config({"profile": "config-profile"})
         
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file), \
-             mock_sync_dependencies(mock_config_path=False) as mocks:
+        with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -1018,7 +975,6 @@ class TestSyncWithConfigDefaults:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             # Specify --profile, should override config
             result = runner.invoke(app, ["sync", "gut-v1", "source-datasets", "--profile", "cli-profile"])
             
@@ -1027,19 +983,13 @@ class TestSyncWithConfigDefaults:
             mocks['load_config'].assert_called_once()
             assert mocks['load_config'].call_args[0][0] == "cli-profile"
 
-    def test_sync_uses_config_atlas_as_default(self, tmp_path, mock_sync_dependencies):
+    def test_sync_uses_config_atlas_as_default(self, runner, user_config, mock_sync_dependencies):
         """Test that sync uses atlas from config when not specified."""
-        config_file = tmp_path / "config.yaml"
+        user_config({"atlas": "immune-v1"})
         
-        # Create config with atlas
-        from hca_smart_sync.config_manager import save_config
-        save_config(config_file, {"atlas": "immune-v1"})
-        
-        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file), \
-             mock_sync_dependencies(mock_config_path=False) as mocks:
+        with mock_sync_dependencies() as mocks:
             
             # Configure mocks
-            mocks['check_aws_cli'].return_value = True
             mock_config = Mock()
             mock_config.s3.bucket_name = "test-bucket"
             mocks['load_config'].return_value = mock_config
@@ -1055,7 +1005,6 @@ class TestSyncWithConfigDefaults:
             }
             mocks['init_sync'].return_value = mock_sync_engine
             
-            runner = CliRunner()
             # Don't specify atlas, should use config default
             result = runner.invoke(app, ["sync", "source-datasets"])
             
@@ -1066,12 +1015,26 @@ class TestSyncWithConfigDefaults:
             # Verify default file_type (source-datasets) was used
             assert mocks['build_s3_path'].call_args[0][2] == "source-datasets"
 
-    def test_sync_no_config_requires_atlas(self, tmp_path):
+    def test_sync_no_config_requires_atlas(self, tmp_path, captured_console):
         """Test that sync requires atlas arg when no config exists."""
         config_file = tmp_path / "nonexistent.yaml"
         
         with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
-            runner = CliRunner()
+            # No config, no atlas arg - call the command callback directly
+            with pytest.raises(click.exceptions.Exit) as exc_info:
+                sync_command(arg1="source-datasets", arg2=None)
+        
+        # Should fail with helpful message about atlas being required
+        assert exc_info.value.exit_code == 1
+        out = captured_console.getvalue().lower()
+        assert "atlas" in out and "required" in out
+    
+    @pytest.mark.integration
+    def test_sync_no_config_requires_atlas_via_runner(self, runner, tmp_path):
+        """Test the missing-atlas error end to end through the Typer runner."""
+        config_file = tmp_path / "nonexistent.yaml"
+        
+        with patch('hca_smart_sync.cli.get_config_path', return_value=config_file):
             # No config, no atlas arg - should fail
             result = runner.invoke(app, ["sync", "source-datasets"])
             
@@ -2,10 +2,20 @@
 
 from pathlib import Path
 
+import pytest
 
 from hca_smart_sync.config import Config, AWSConfig, S3Config
 
 
+@pytest.fixture
+def set_env(monkeypatch):
+    """Set a batch of environment variables, undone at teardown."""
+    def _set_env(**env: str) -> None:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+    return _set_env
+
+
 class TestConfig:
     """Test configuration management."""
     
@@ -36,13 +46,15 @@ class TestConfig:
         assert s3_config.multipart_threshold == 64 * 1024 * 1024
         assert s3_config.max_concurrency == 10
     
-    def test_config_from_env(self, monkeypatch):
+    def test_config_from_env(self, set_env):
         """Test configuration from environment variables."""
         # Set test environment variables
-        monkeypatch.setenv("HCA_AWS_PROFILE", "test-profile")
-        monkeypatch.setenv("HCA_AWS_REGION", "us-west-2")
-        monkeypatch.setenv("HCA_S3_BUCKET", "test-bucket")
-        monkeypatch.setenv("HCA_VERBOSE", "true")
+        set_env(
+            HCA_AWS_PROFILE="test-profile",
+            HCA_AWS_REGION="us-west-2",
+            HCA_S3_BUCKET="test-bucket",
+            HCA_VERBOSE="true",
+        )
         
         config = Config.from_env()
         
@@ -1,9 +1,17 @@
 """Tests for user configuration management."""
 
+from unittest.mock import patch
+
 import pytest
 import yaml
 
-from hca_smart_sync.config_manager import get_config_path, load_config, save_config
+from hca_smart_sync.config_manager import (
+    YAML_DUMPER,
+    YAML_LOADER,
+    get_config_path,
+    load_config,
+    save_config,
+)
 
 
 class TestConfigPath:
@@ -17,6 +25,21 @@ class TestConfigPath:
         assert config_path.parent.name == ".hca-smart-sync"
 
 
+class TestYamlBackend:
+    """Tests for the YAML loader/dumper selection."""
+
+    @pytest.mark.xfail(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_libyaml_backend(self):
+        """Test that the C-accelerated safe loader and dumper are selected."""
+        assert YAML_LOADER is yaml.CSafeLoader
+        assert YAML_DUMPER is yaml.CSafeDumper
+
+    def test_backend_is_safe(self):
+        """Test that the selected loader refuses arbitrary Python objects."""
+        with pytest.raises(yaml.YAMLError):
+            yaml.load("!!python/object/apply:os.getcwd []", Loader=YAML_LOADER)
+
+
 class TestLoadConfig:
     """Tests for loading configuration."""
 
@@ -27,7 +50,7 @@ class TestLoadConfig:
 
         # Write test config
         with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER)
 
         # Load and verify
         loaded_config = load_config(config_file)
@@ -65,7 +88,7 @@ class TestLoadConfig:
         config_data = {"profile": "test-profile"}
 
         with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER)
 
         loaded_config = load_config(config_file)
         assert loaded_config is not None
@@ -78,13 +101,36 @@ class TestLoadConfig:
         config_data = {"atlas": "immune-v1"}
 
         with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER)
 
         loaded_config = load_config(config_file)
         assert loaded_config is not None
         assert loaded_config["atlas"] == "immune-v1"
         assert "profile" not in loaded_config
 
+    def test_load_config_cached_reuse(self, tmp_path):
+        """Test that repeated loads of an unchanged file don't re-read it."""
+        config_file = tmp_path / "config.yaml"
+        save_config(config_file, {"profile": "test-profile"})
+
+        first = load_config(config_file)
+        with patch("builtins.open", side_effect=AssertionError("config re-read")):
+            second = load_config(config_file)
+
+        assert second == first == {"profile": "test-profile"}
+        # Callers get their own copy, not the cached object
+        second["profile"] = "mutated"
+        assert load_config(config_file)["profile"] == "test-profile"
+
+    def test_load_config_cache_invalidated_on_change(self, tmp_path):
+        """Test that editing the file is picked up on the next load."""
+        config_file = tmp_path / "config.yaml"
+        save_config(config_file, {"profile": "old-profile"})
+        assert load_config(config_file)["profile"] == "old-profile"
+
+        save_config(config_file, {"profile": "new-profile", "atlas": "gut-v1"})
+        assert load_config(config_file) == {"profile": "new-profile", "atlas": "gut-v1"}
+
 
 class TestSaveConfig:
     """Tests for saving configuration."""
@@ -1,163 +1,116 @@
 """Tests for checksum and manifest functionality."""
 
 import json
-import tempfile
-from pathlib import Path
+import os
+import re
+import shutil
 import hashlib
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from natsort import natsorted
 
-from hca_smart_sync.checksum import ChecksumCalculator
+from hca_smart_sync.checksum import DEFAULT_CHUNK_SIZE, ChecksumCache, ChecksumCalculator
 from hca_smart_sync.manifest import ManifestGenerator
 
 
+@pytest.fixture(scope="module")
+def calculator():
+    """Stateless checksum calculator shared across the module."""
+    return ChecksumCalculator()
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Manifest generator shared across the module."""
+    return ManifestGenerator()
+
+
+@pytest.fixture(scope="session")
+def shasum_path():
+    """Location of the external shasum tool, looked up once per session."""
+    return shutil.which('shasum')
+
+
+# Known answer: this SHA256 was calculated with our helper script and verified
+KNOWN_ANSWER_CONTENT = b"Hello, HCA World! This is a test file for checksum validation."
+KNOWN_ANSWER_SHA256 = "5829c2cba87286e32a50f6a136c00eec2970c4b881f52875809622edc6a221a5"
+
+# Lowercase hex, as hashlib.hexdigest() returns it
+SHA256_HEX_RE = re.compile(r"[0-9a-f]{64}")
+
+# Payloads hashed by test_sha256_calculation; expected None means "compare to hashlib"
+CHECKSUM_CASES = [
+    pytest.param(KNOWN_ANSWER_CONTENT, KNOWN_ANSWER_SHA256, id="known_answer"),
+    # Larger than the default chunk size (2+ chunks)
+    pytest.param(b"A" * (DEFAULT_CHUNK_SIZE * 2 + 100), None, id="multi_chunk"),
+    # Chunk boundary edge cases
+    pytest.param(b"B" * DEFAULT_CHUNK_SIZE, None, id="exactly_chunk"),
+    pytest.param(b"B" * (DEFAULT_CHUNK_SIZE + 1), None, id="chunk_plus_one"),
+    pytest.param(b"B" * (DEFAULT_CHUNK_SIZE - 1), None, id="chunk_minus_one"),
+]
+
+
 class TestChecksumCalculator:
     """Test checksum calculation functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.calculator = ChecksumCalculator()
-    
-    def test_sha256_known_answer(self):
-        """Test SHA256 calculation against known answer from fixture file."""
-        # Create fixture file with known content
-        fixture_content = b"Hello, HCA World! This is a test file for checksum validation."
-        # This SHA256 was calculated with our helper script and verified
-        expected_sha256 = "5829c2cba87286e32a50f6a136c00eec2970c4b881f52875809622edc6a221a5"
+    @pytest.mark.parametrize("content, expected_sha256", CHECKSUM_CASES)
+    def test_sha256_calculation(self, calculator, tmp_path, content, expected_sha256):
+        """Test SHA256 calculation for known-answer, multi-chunk and chunk-boundary files."""
+        if expected_sha256 is None:
+            # Calculate expected hash using Python's hashlib directly
+            expected_sha256 = hashlib.sha256(content).hexdigest()
         
-        # Create fixture directory if it doesn't exist
-        fixture_dir = Path(__file__).parent / "fixtures"
-        fixture_dir.mkdir(exist_ok=True)
+        fixture_path = tmp_path / "fixture.bin"
+        fixture_path.write_bytes(content)
         
-        fixture_path = fixture_dir / "small.txt"
+        # Calculate checksum using our chunked implementation
+        actual_sha256 = calculator.calculate_sha256(fixture_path)
         
-        # Write fixture file
-        with open(fixture_path, 'wb') as f:
-            f.write(fixture_content)
+        # Verify our chunked reading produces the expected digest
+        assert actual_sha256 == expected_sha256, f"Expected {expected_sha256}, got {actual_sha256}"
         
-        try:
-            # Calculate checksum using our implementation
-            actual_sha256 = self.calculator.calculate_sha256(fixture_path)
-            
-            # Verify against known answer
-            assert actual_sha256 == expected_sha256, f"Expected {expected_sha256}, got {actual_sha256}"
-            
-            # Verify it's a valid SHA256 format
-            assert len(actual_sha256) == 64
-            assert all(c in '0123456789abcdef' for c in actual_sha256.lower())
-            
-        finally:
-            # Clean up fixture file
-            if fixture_path.exists():
-                fixture_path.unlink()
+        # Verify it's a valid SHA256 format
+        assert SHA256_HEX_RE.fullmatch(actual_sha256)
 
-    def test_sha256_large_file_multi_chunk(self):
-        """Test SHA256 calculation for file larger than chunk size (8192 bytes)."""
-        # Create content larger than default chunk size (8192 bytes)
-        # Use deterministic content so we can verify the hash
-        chunk_size = 8192
-        large_content = b"A" * (chunk_size * 2 + 100)  # 16484 bytes (2+ chunks)
+    def test_sha256_shared_across_threads(self, calculator, tmp_path):
+        """Test that one calculator hashes different files concurrently without mixing state."""
+        payloads = [param.values[0] for param in CHECKSUM_CASES]
+        paths = []
+        for i, content in enumerate(payloads):
+            path = tmp_path / f"threaded_{i}.bin"
+            path.write_bytes(content)
+            paths.append(path)
         
-        # Calculate expected hash using Python's hashlib directly
-        expected_sha256 = hashlib.sha256(large_content).hexdigest()
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            digests = list(executor.map(calculator.calculate_sha256, paths))
         
-        # Create fixture directory if it doesn't exist
-        fixture_dir = Path(__file__).parent / "fixtures"
-        fixture_dir.mkdir(exist_ok=True)
-        
-        fixture_path = fixture_dir / "large.txt"
-        
-        # Write large fixture file
-        with open(fixture_path, 'wb') as f:
-            f.write(large_content)
-        
-        try:
-            # Calculate checksum using our chunked implementation
-            actual_sha256 = self.calculator.calculate_sha256(fixture_path)
-            
-            # Verify our chunked reading produces same result as direct calculation
-            assert actual_sha256 == expected_sha256, f"Expected {expected_sha256}, got {actual_sha256}"
-            
-            # Verify it's a valid SHA256 format
-            assert len(actual_sha256) == 64
-            assert all(c in '0123456789abcdef' for c in actual_sha256.lower())
-            
-        finally:
-            # Clean up fixture file
-            if fixture_path.exists():
-                fixture_path.unlink()
-
-    def test_sha256_chunk_boundaries(self):
-        """Test SHA256 calculation for files at chunk boundaries (edge cases)."""
-        chunk_size = 8192  # Default chunk size from ChecksumCalculator
-        
-        # Test cases: exactly chunk size, chunk + 1, chunk - 1
-        test_cases = [
-            ("exactly_chunk", chunk_size),      # 8192 bytes - exactly one chunk
-            ("chunk_plus_one", chunk_size + 1), # 8193 bytes - chunk + 1 byte
-            ("chunk_minus_one", chunk_size - 1), # 8191 bytes - chunk - 1 byte
-        ]
-        
-        fixture_dir = Path(__file__).parent / "fixtures"
-        fixture_dir.mkdir(exist_ok=True)
-        
-        for test_name, file_size in test_cases:
-            # Create deterministic content of exact size
-            boundary_content = b"B" * file_size
-            
-            # Calculate expected hash using Python's hashlib directly
-            expected_sha256 = hashlib.sha256(boundary_content).hexdigest()
-            
-            fixture_path = fixture_dir / f"{test_name}.txt"
-            
-            # Write boundary test file
-            with open(fixture_path, 'wb') as f:
-                f.write(boundary_content)
-            
-            try:
-                # Calculate checksum using our chunked implementation
-                actual_sha256 = self.calculator.calculate_sha256(fixture_path)
-                
-                # Verify our chunked reading produces same result as direct calculation
-                assert actual_sha256 == expected_sha256, f"{test_name}: Expected {expected_sha256}, got {actual_sha256}"
-                
-                # Verify it's a valid SHA256 format
-                assert len(actual_sha256) == 64
-                assert all(c in '0123456789abcdef' for c in actual_sha256.lower())
-                
-            finally:
-                # Clean up fixture file
-                if fixture_path.exists():
-                    fixture_path.unlink()
+        assert digests == [hashlib.sha256(content).hexdigest() for content in payloads]
 
-    def test_sha256_cross_validation_with_shasum(self):
+    @pytest.mark.slow
+    def test_sha256_cross_validation_with_shasum(self, calculator, shasum_path, tmp_path):
         """Test SHA256 calculation against external shasum command-line tool."""
         import subprocess
-        import shutil
         
         # Check if shasum is available (should be on macOS/Linux)
-        if not shutil.which('shasum'):
+        if not shasum_path:
             pytest.skip("shasum command not available on this system")
         
         # Create test content for cross-validation
         cross_val_content = b"Cross-validation test content for biological data integrity verification."
         
-        fixture_dir = Path(__file__).parent / "fixtures"
-        fixture_dir.mkdir(exist_ok=True)
-        
-        fixture_path = fixture_dir / "cross_validation.txt"
-        
-        # Write test file
-        with open(fixture_path, 'wb') as f:
-            f.write(cross_val_content)
+        fixture_path = tmp_path / "cross_validation.txt"
+        fixture_path.write_bytes(cross_val_content)
         
         try:
             # Calculate checksum using our implementation
-            our_sha256 = self.calculator.calculate_sha256(fixture_path)
+            our_sha256 = calculator.calculate_sha256(fixture_path)
             
             # Calculate checksum using external shasum tool
             result = subprocess.run(
-                ['shasum', '-a', '256', str(fixture_path)],
-                capture_output=True,
+                [shasum_path, '-a', '256', str(fixture_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 check=True
             )
@@ -170,143 +123,211 @@ class TestChecksumCalculator:
             assert our_sha256 == external_sha256, f"Our implementation: {our_sha256}, shasum: {external_sha256}"
             
             # Verify it's a valid SHA256 format
-            assert len(our_sha256) == 64
-            assert all(c in '0123456789abcdef' for c in our_sha256.lower())
+            assert SHA256_HEX_RE.fullmatch(our_sha256)
             
         except subprocess.CalledProcessError as e:
             pytest.fail(f"shasum command failed: {e}")
-        finally:
-            # Clean up fixture file
-            if fixture_path.exists():
-                fixture_path.unlink()
 
-    def test_checksum_verification(self):
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_sha256_advises_sequential_read(self, calculator, tmp_path):
+        """Test that hashing hints sequential access to the kernel."""
+        fixture_path = tmp_path / "fixture.bin"
+        fixture_path.write_bytes(KNOWN_ANSWER_CONTENT)
+
+        with patch('os.posix_fadvise') as mock_fadvise:
+            assert calculator.calculate_sha256(fixture_path) == KNOWN_ANSWER_SHA256
+
+        mock_fadvise.assert_called_once()
+        assert mock_fadvise.call_args[0][1:] == (0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    def test_checksum_verification(self, calculator, tmp_path):
         """Test checksum verification functionality."""
-        test_content = b"Test content for verification"
+        temp_path = tmp_path / "verify.bin"
+        temp_path.write_bytes(b"Test content for verification")
         
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(test_content)
-            temp_file.flush()
-            
-            temp_path = Path(temp_file.name)
-            
-            try:
-                # Calculate checksum
-                checksum = self.calculator.calculate_sha256(temp_path)
-                
-                # Verify with correct checksum
-                assert self.calculator.verify_checksum(temp_path, checksum) is True
-                
-                # Verify with incorrect checksum
-                wrong_checksum = "0" * 64
-                assert self.calculator.verify_checksum(temp_path, wrong_checksum) is False
-                
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
+        # Calculate checksum
+        checksum = calculator.calculate_sha256(temp_path)
+        
+        # Verify with correct checksum
+        assert calculator.verify_checksum(temp_path, checksum) is True
+        
+        # Verify with incorrect checksum
+        wrong_checksum = "0" * 64
+        assert calculator.verify_checksum(temp_path, wrong_checksum) is False
+
+
+class TestChecksumCache:
+    """Test the persistent checksum cache."""
+    
+    def test_round_trip_and_invalidation(self, tmp_path):
+        """Test that entries persist across loads and are dropped when the file changes."""
+        data_file = tmp_path / "data.h5ad"
+        data_file.write_bytes(b"original")
+        cache_path = tmp_path / "cache" / "checksums.json"
+        
+        cache = ChecksumCache(cache_path)
+        cache.set(data_file, data_file.stat(), "abc123")
+        cache.save()
+        
+        reloaded = ChecksumCache(cache_path)
+        assert reloaded.get(data_file, data_file.stat()) == "abc123"
+        
+        data_file.write_bytes(b"modified content")
+        assert reloaded.get(data_file, data_file.stat()) is None
+    
+    def test_save_evicts_least_recently_used(self, tmp_path):
+        """Test that saving keeps only the most recently used entries."""
+        files = []
+        for i in range(3):
+            data_file = tmp_path / f"data{i}.h5ad"
+            data_file.write_bytes(f"content {i}".encode())
+            files.append(data_file)
+        cache_path = tmp_path / "checksums.json"
+        
+        cache = ChecksumCache(cache_path, max_entries=2)
+        for i, data_file in enumerate(files[:2]):
+            cache.set(data_file, data_file.stat(), f"sha{i}")
+        # A hit refreshes data0, so data1 becomes the oldest entry
+        assert cache.get(files[0], files[0].stat()) == "sha0"
+        cache.set(files[2], files[2].stat(), "sha2")
+        cache.save()
+        
+        reloaded = ChecksumCache(cache_path)
+        assert [reloaded.get(f, f.stat()) for f in files] == ["sha0", None, "sha2"]
+    
+    def test_save_uses_unique_temp_file(self, tmp_path):
+        """Test that each save writes its own temp file and leaves none behind."""
+        data_file = tmp_path / "data.h5ad"
+        data_file.write_bytes(b"content")
+        cache_dir = tmp_path / "cache"
+        cache_path = cache_dir / "checksums.json"
+        
+        with patch('os.replace', wraps=os.replace) as mock_replace:
+            for checksum in ("first", "second"):
+                cache = ChecksumCache(cache_path)
+                cache.set(data_file, data_file.stat(), checksum)
+                cache.save()
+        
+        temp_names = [call.args[0] for call in mock_replace.call_args_list]
+        assert len(set(temp_names)) == 2
+        assert [p.name for p in cache_dir.iterdir()] == ["checksums.json"]
+        assert ChecksumCache(cache_path).get(data_file, data_file.stat()) == "second"
+    
+    def test_unreadable_cache_starts_empty(self, tmp_path):
+        """Test that a corrupt cache file is ignored rather than failing the scan."""
+        data_file = tmp_path / "data.h5ad"
+        data_file.write_bytes(b"content")
+        cache_path = tmp_path / "checksums.json"
+        cache_path.write_text("{not json")
+        
+        cache = ChecksumCache(cache_path)
+        
+        assert cache.get(data_file, data_file.stat()) is None
 
 
 class TestManifestGenerator:
     """Test manifest generation functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = ManifestGenerator()
-    
-    def test_manifest_generation(self):
+    def test_manifest_generation(self, generator, tmp_path):
         """Test basic manifest generation."""
-        # Create temporary test files
+        # Create test files
         test_files = []
-        temp_dir = Path(tempfile.mkdtemp())
+        for i in range(2):
+            test_file = tmp_path / f"test_file_{i}.h5ad"
+            test_file.write_bytes(f"Test content {i}".encode())
+            test_files.append(test_file)
         
-        try:
-            # Create test files
-            for i in range(2):
-                test_file = temp_dir / f"test_file_{i}.h5ad"
-                test_file.write_text(f"Test content {i}")
-                test_files.append(test_file)
-            
-            # Generate manifest
-            metadata = {"study": "test-study", "version": "1.0"}
-            submitter_info = {"name": "Test User", "email": "test@example.com"}
-            
-            manifest = self.generator.generate_manifest(
-                files=test_files,
-                metadata=metadata,
-                submitter_info=submitter_info
-            )
-            
-            # Verify manifest structure
-            assert "manifest_version" in manifest
-            assert "generated_at" in manifest
-            assert "submission_id" in manifest
-            assert "files" in manifest
-            assert "metadata" in manifest
-            assert "submitter" in manifest
-            
-            # Verify metadata
-            assert manifest["metadata"] == metadata
-            assert manifest["submitter"] == submitter_info
-            
-            # Verify files
-            assert len(manifest["files"]) == 2
-            for file_info in manifest["files"]:
-                assert "filename" in file_info
-                assert "size_bytes" in file_info
-                assert "sha256" in file_info
-                assert "modified_at" in file_info
-                
-        finally:
-            # Clean up
-            for file_path in test_files:
-                if file_path.exists():
-                    file_path.unlink()
-            temp_dir.rmdir()
+        # Generate manifest
+        metadata = {"study": "test-study", "version": "1.0"}
+        submitter_info = {"name": "Test User", "email": "test@example.com"}
+        
+        manifest = generator.generate_manifest(
+            files=test_files,
+            metadata=metadata,
+            submitter_info=submitter_info
+        )
+        
+        # Verify manifest structure
+        assert "manifest_version" in manifest
+        assert "generated_at" in manifest
+        assert "submission_id" in manifest
+        assert "files" in manifest
+        assert "metadata" in manifest
+        assert "submitter" in manifest
+        
+        # Verify metadata
+        assert manifest["metadata"] == metadata
+        assert manifest["submitter"] == submitter_info
+        
+        # Verify files
+        assert len(manifest["files"]) == 2
+        for file_info in manifest["files"]:
+            assert "filename" in file_info
+            assert "size_bytes" in file_info
+            assert "sha256" in file_info
+            assert "modified_at" in file_info
+    
+    def test_manifest_reuses_precomputed_checksums(self, tmp_path):
+        """Test that checksums passed in are used and only the rest are hashed."""
+        known = tmp_path / "known.h5ad"
+        known.write_bytes(b"already hashed")
+        unknown = tmp_path / "unknown.h5ad"
+        unknown.write_bytes(b"needs hashing")
+        
+        generator = ManifestGenerator()
+        with patch.object(generator.checksum_calculator, 'calculate_sha256', return_value="computed") as mock_sha256:
+            manifest = generator.generate_manifest(files=[known, unknown], checksums={known: "precomputed"})
+        
+        mock_sha256.assert_called_once_with(unknown)
+        assert [f["sha256"] for f in manifest["files"]] == ["precomputed", "computed"]
     
-    def test_manifest_natural_sorting_order(self):
+    def test_manifest_timestamps_are_utc(self, generator, tmp_path):
+        """Test that file modification times are reported in UTC with a Z suffix."""
+        test_file = tmp_path / "stamped.h5ad"
+        test_file.write_bytes(b"content")
+        os.utime(test_file, ns=(0, 1_700_000_000_500_000_000))
+        
+        manifest = generator.generate_manifest(files=[test_file])
+        
+        assert manifest["files"][0]["modified_at"] == "2023-11-14T22:13:20.500000Z"
+        assert manifest["generated_at"].endswith("Z")
+    
+    def test_manifest_natural_sorting_order(self, generator, tmp_path):
         """Test that manifest generation uses natural sorting for file order."""
-        # Create temporary test files with names that sort differently with natural vs lexicographic sorting
+        # Create test files with names that sort differently with natural vs lexicographic sorting
         test_files = []
-        temp_dir = Path(tempfile.mkdtemp())
+        filenames = ['file10.h5ad', 'file2.h5ad', 'file1.h5ad']  # Intentionally out of natural order
+        for filename in filenames:
+            test_file = tmp_path / filename
+            test_file.write_bytes(f"Test content for {filename}".encode())
+            test_files.append(test_file)
         
-        try:
-            # Create test files in a specific order that would be different with lexicographic sorting
-            filenames = ['file10.h5ad', 'file2.h5ad', 'file1.h5ad']  # Intentionally out of natural order
-            for filename in filenames:
-                test_file = temp_dir / filename
-                test_file.write_text(f"Test content for {filename}")
-                test_files.append(test_file)
-            
-            # Generate manifest
-            metadata = {"study": "test-study", "version": "1.0"}
-            submitter_info = {"name": "Test User", "email": "test@example.com"}
-            
-            manifest = self.generator.generate_manifest(
-                files=test_files,
-                metadata=metadata,
-                submitter_info=submitter_info
-            )
-            
-            # Verify manifest structure
-            assert "files" in manifest
-            assert len(manifest["files"]) == 3
-            
-            # Verify natural sorting order in manifest: file1.h5ad, file2.h5ad, file10.h5ad
-            # (NOT lexicographic order which would be: file1.h5ad, file10.h5ad, file2.h5ad)
-            filenames_in_manifest = [file_info["filename"] for file_info in manifest["files"]]
-            expected_natural_order = ['file1.h5ad', 'file2.h5ad', 'file10.h5ad']
-            
-            assert filenames_in_manifest == expected_natural_order, (
-                f"Expected natural sort order {expected_natural_order}, "
-                f"but got {filenames_in_manifest}"
-            )
-            
-        finally:
-            # Clean up
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Generate manifest
+        metadata = {"study": "test-study", "version": "1.0"}
+        submitter_info = {"name": "Test User", "email": "test@example.com"}
+        
+        manifest = generator.generate_manifest(
+            files=test_files,
+            metadata=metadata,
+            submitter_info=submitter_info
+        )
+        
+        # Verify manifest structure
+        assert "files" in manifest
+        assert len(manifest["files"]) == 3
+        
+        # Verify natural sorting order in manifest: file1.h5ad, file2.h5ad, file10.h5ad
+        # (NOT lexicographic order which would be: file1.h5ad, file10.h5ad, file2.h5ad)
+        filenames_in_manifest = [file_info["filename"] for file_info in manifest["files"]]
+        expected_natural_order = natsorted(filenames)
+        assert expected_natural_order != sorted(filenames)
+        
+        assert filenames_in_manifest == expected_natural_order, (
+            f"Expected natural sort order {expected_natural_order}, "
+            f"but got {filenames_in_manifest}"
+        )
     
-    def test_manifest_save(self):
+    def test_manifest_save(self, generator, tmp_path):
         """Test saving manifest to file."""
         # Create a simple manifest
         manifest = {
@@ -315,21 +336,15 @@ class TestManifestGenerator:
             "metadata": {},
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        temp_path = tmp_path / "manifest.json"
         
-        try:
-            # Save manifest
-            self.generator.save_manifest(manifest, temp_path)
-            
-            # Verify file was created and contains valid JSON
-            assert temp_path.exists()
-            
-            with open(temp_path, 'r') as f:
-                loaded_manifest = json.load(f)
-            
-            assert loaded_manifest == manifest
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Save manifest
+        generator.save_manifest(manifest, temp_path)
+        
+        # Verify file was created and contains valid JSON
+        assert temp_path.exists()
+        
+        with open(temp_path, 'r') as f:
+            loaded_manifest = json.load(f)
+        
+        assert loaded_manifest == manifest
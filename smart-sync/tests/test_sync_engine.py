@@ -1,83 +1,217 @@
 """Tests for sync engine functionality."""
 
-import tempfile
-import subprocess
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
+import boto3
 import pytest
+from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.stub import Stubber
+from natsort import natsorted
 
 from hca_smart_sync.config import Config, AWSConfig, S3Config, ManifestConfig
-from hca_smart_sync.sync_engine import SmartSync
+from hca_smart_sync.sync_engine import CLIENT_CONFIG, SmartSync, _get_session
+
+
+@pytest.fixture(scope="module")
+def sync_config():
+    """Test configuration shared across the module (SmartSync instances stay per test)."""
+    return Config(
+        aws=AWSConfig(
+            profile="test-profile",
+            region="us-east-1"
+        ),
+        s3=S3Config(
+            bucket="test-bucket",
+            prefix="test-atlas/source-datasets"
+        ),
+        manifest=ManifestConfig(
+            filename_template="manifest-{timestamp}.json"
+        ),
+        checksum_cache_path=None
+    )
+
+# botocore errors built once at import and shared by the tests that raise them
+NO_SUCH_KEY_ERROR = ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'HeadObject')
+NOT_FOUND_ERROR = ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+ACCESS_DENIED_ERROR = ClientError(
+    {'Error': {'Code': 'AccessDenied', 'Message': 'Access denied to S3 bucket'}},
+    'PutObject'
+)
+
+
+def make_h5ad(directory, name, data=b"x"):
+    """Write a small test file with a single open/write/close."""
+    fd = os.open(os.path.join(directory, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return Path(directory) / name
+
+
+def mock_listing(mock_s3_client, sizes):
+    """Make the list_objects_v2 paginator return ``{filename: size}`` under ``path/``."""
+    contents = [{'Key': f'path/{name}', 'Size': size, 'ETag': '"etag"'} for name, size in sizes.items()]
+    mock_s3_client.get_paginator.return_value.paginate.return_value = [{'Contents': contents}]
+
+
+@pytest.fixture
+def mock_session(monkeypatch):
+    """Replace boto3.Session for one test and return the mock."""
+    session = Mock()
+    monkeypatch.setattr(boto3, "Session", session)
+    return session
+
+
+@pytest.fixture
+def local_file():
+    """Factory for scan records as returned by _scan_local_files."""
+    def _make(filename="test.h5ad", **overrides):
+        return {
+            'filename': filename,
+            'local_path': Path('/tmp') / filename,
+            'size': 1024,
+            'checksum': 'abc123',
+            'mtime_ns': 1672531200000000000,
+            **overrides,
+        }
+    return _make
+
+
+@pytest.fixture
+def upload_tool(monkeypatch, request):
+    """Pin upload tool detection ('boto3' unless parametrized indirectly)."""
+    tool = getattr(request, "param", "boto3")
+    monkeypatch.setattr(SmartSync, "_detect_upload_tool", lambda self: tool)
+    return tool
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    """Keep boto3 sessions (real or patched) from leaking between tests."""
+    _get_session.cache_clear()
+    yield
+    _get_session.cache_clear()
 
 
 class TestSmartSync:
     """Test SmartSync engine functionality."""
     
-    def setup_method(self):
-        """Set up test configuration."""
-        self.config = Config(
-            aws=AWSConfig(
-                profile="test-profile",
-                region="us-east-1"
-            ),
-            s3=S3Config(
-                bucket="test-bucket",
-                prefix="test-atlas/source-datasets"
-            ),
-            manifest=ManifestConfig(
-                filename_template="manifest-{timestamp}.json"
-            )
-        )
+    @pytest.fixture(scope="class")
+    def sync(self, sync_config):
+        """Engine shared by tests of helpers that never touch instance state."""
+        return SmartSync(sync_config)
     
-    def test_init(self):
+    def test_init(self, sync_config):
         """Test SmartSync initialization."""
-        sync = SmartSync(self.config)
+        sync = SmartSync(sync_config)
         
-        assert sync.config == self.config
+        assert sync.config == sync_config
         assert sync._s3_client is None  # Lazy initialization
         assert sync.checksum_calculator is not None
         assert sync.manifest_generator is not None
     
-    def test_scan_local_files_empty_directory(self):
-        """Test scanning an empty directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            sync = SmartSync(self.config)
-            files = sync._scan_local_files(Path(temp_dir))
-            
-            assert files == []
+    @pytest.mark.parametrize("files,expected", [
+        pytest.param([], set(), id="empty_directory"),
+        pytest.param(
+            [("file1.h5ad", b"test data 1"), ("file2.h5ad", b"test data 2"), ("other.txt", b"not h5ad")],
+            {"file1.h5ad", "file2.h5ad"},
+            id="with_h5ad_files",
+        ),
+    ])
+    def test_scan_local_files(self, sync_config, tmp_path, files, expected):
+        """Test that scanning finds only .h5ad files, each with the expected fields."""
+        for name, data in files:
+            make_h5ad(tmp_path, name, data)
+        
+        sync = SmartSync(sync_config)
+        scanned = sync._scan_local_files(tmp_path)
+        
+        # Should only find .h5ad files
+        assert len(scanned) == len(expected)
+        assert {f['filename'] for f in scanned} == expected
+        
+        # Check that each file has the expected structure
+        expected_keys = {'local_path', 'filename', 'size', 'checksum', 'mtime_ns'}
+        assert all(expected_keys <= file_info.keys() for file_info in scanned)
     
-    def test_scan_local_files_with_h5ad_files(self):
-        """Test scanning directory with .h5ad files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test .h5ad files
-            (temp_path / "file1.h5ad").write_text("test data 1")
-            (temp_path / "file2.h5ad").write_text("test data 2")
-            (temp_path / "other.txt").write_text("not h5ad")
-            
-            sync = SmartSync(self.config)
-            files = sync._scan_local_files(temp_path)
-            
-            # Should only find .h5ad files
-            assert len(files) == 2
-            file_names = [f['filename'] for f in files]
-            assert "file1.h5ad" in file_names
-            assert "file2.h5ad" in file_names
-            assert "other.txt" not in file_names
+    def test_scan_local_files_1000_files(self, sync_config, tmp_path):
+        """Test scanning a large directory returns every file in natural order."""
+        prototype = make_h5ad(tmp_path, "prototype.bin", b"")
+        for i in range(1000):
+            # Hard links avoid writing 1000 separate files
+            os.link(prototype, tmp_path / f"file{i}.h5ad")
+        
+        files = SmartSync(sync_config)._scan_local_files(tmp_path)
+        
+        assert len(files) == 1000
+        assert [f['filename'] for f in files[:3]] == ["file0.h5ad", "file1.h5ad", "file2.h5ad"]
+        assert files[-1]['filename'] == "file999.h5ad"
+        assert {f['checksum'] for f in files} == {hashlib.sha256(b"").hexdigest()}
+    
+    def test_scan_local_files_parallel_matches_serial(self, sync_config, tmp_path):
+        """Test threaded checksumming returns the same naturally sorted results as serial."""
+        for i in (10, 2, 1):
+            make_h5ad(tmp_path, f"file{i}.h5ad", f"test data {i}".encode())
+        
+        serial = SmartSync(sync_config.model_copy(update={"checksum_workers": 1}))
+        parallel = SmartSync(sync_config.model_copy(update={"checksum_workers": 4}))
+        
+        serial_files = serial._scan_local_files(tmp_path)
+        parallel_files = parallel._scan_local_files(tmp_path)
+        
+        assert [f['filename'] for f in parallel_files] == ["file1.h5ad", "file2.h5ad", "file10.h5ad"]
+        assert parallel_files == serial_files
+    
+    def test_scan_local_files_reuses_cached_checksums(self, sync_config, tmp_path):
+        """Test that a second scan of unchanged files skips hashing."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        make_h5ad(data_dir, "file1.h5ad", b"test data 1")
+        make_h5ad(data_dir, "file2.h5ad", b"test data 2")
+        config = sync_config.model_copy(update={"checksum_cache_path": tmp_path / "checksums.json"})
+        
+        first = SmartSync(config)._scan_local_files(data_dir)
+        
+        # A fresh engine loads the cache from disk rather than rehashing
+        sync = SmartSync(config)
+        with patch.object(sync.checksum_calculator, 'calculate_sha256') as mock_sha256:
+            second = sync._scan_local_files(data_dir)
+            assert mock_sha256.call_count == 0
             
-            # Check that each file has the expected structure
-            for file_info in files:
-                assert 'local_path' in file_info
-                assert 'filename' in file_info
-                assert 'size' in file_info
-                assert 'checksum' in file_info
-                assert 'modified' in file_info
+            # Modifying a file invalidates only its entry
+            (data_dir / "file2.h5ad").write_text("changed data 2")
+            mock_sha256.return_value = "new-checksum"
+            third = sync._scan_local_files(data_dir)
+            mock_sha256.assert_called_once_with(data_dir / "file2.h5ad")
+        
+        assert [f['checksum'] for f in second] == [f['checksum'] for f in first]
+        assert third[0]['checksum'] == first[0]['checksum']
+        assert third[1]['checksum'] == "new-checksum"
+    
+    def test_scan_local_files_without_cache_rehashes(self, sync_config, tmp_path):
+        """Test that a forced scan ignores cached checksums but refreshes the cache."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        make_h5ad(data_dir, "file1.h5ad", b"test data 1")
+        config = sync_config.model_copy(update={"checksum_cache_path": tmp_path / "checksums.json"})
+        SmartSync(config)._scan_local_files(data_dir)
+        
+        sync = SmartSync(config)
+        with patch.object(sync.checksum_calculator, 'calculate_sha256', return_value="rehashed") as mock_sha256:
+            files = sync._scan_local_files(data_dir, use_cache=False)
+        
+        mock_sha256.assert_called_once_with(data_dir / "file1.h5ad")
+        assert files[0]['checksum'] == "rehashed"
+        assert SmartSync(config).checksum_cache.get(data_dir / "file1.h5ad", (data_dir / "file1.h5ad").stat()) == "rehashed"
     
-    def test_parse_s3_path(self):
+    def test_parse_s3_path(self, sync):
         """Test S3 path parsing."""
-        sync = SmartSync(self.config)
-        
         bucket, key = sync._parse_s3_path("s3://test-bucket/path/to/folder")
         assert bucket == "test-bucket"
         assert key == "path/to/folder"
@@ -86,19 +220,24 @@ class TestSmartSync:
         assert bucket == "my-bucket"
         assert key == ""
     
-    @patch('boto3.Session')
-    def test_s3_client_lazy_initialization(self, mock_session):
+    def test_s3_client_lazy_initialization(self, mock_session, sync_config):
         """Test that S3 client is created lazily."""
         mock_client = Mock()
         mock_session.return_value.client.return_value = mock_client
         
-        sync = SmartSync(self.config)
+        sync = SmartSync(sync_config)
         
         # First access should create the client
         client1 = sync.s3_client
         assert client1 == mock_client
         mock_session.assert_called_once_with(profile_name="test-profile")
         
+        # The client is built with the shared pooled, keepalive config
+        boto_config = mock_session.return_value.client.call_args[1]['config']
+        assert boto_config is CLIENT_CONFIG
+        assert boto_config.max_pool_connections == 64
+        assert boto_config.tcp_keepalive is True
+        
         # Second access should return the same client
         client2 = sync.s3_client
         assert client2 == mock_client
@@ -107,9 +246,47 @@ class TestSmartSync:
         # Session should only be called once (cached)
         mock_session.assert_called_once()
     
-    def test_reset_aws_clients(self):
+    def test_session_cached_across_instances(self, mock_session, sync_config):
+        """Test that SmartSync instances with the same profile share one session."""
+        first = SmartSync(sync_config)
+        second = SmartSync(sync_config)
+        
+        first.s3_client
+        second.s3_client
+        
+        mock_session.assert_called_once_with(profile_name="test-profile")
+        assert mock_session.return_value.client.call_count == 2
+    
+    def test_validate_s3_access_single_request(self, sync_config):
+        """Test that access validation is one prefix-scoped list call."""
+        sync = SmartSync(sync_config)
+        sync._s3_client = Mock()
+        
+        assert sync._validate_s3_access("s3://test-bucket/test-atlas/source-datasets/") is True
+        
+        sync._s3_client.list_objects_v2.assert_called_once_with(
+            Bucket="test-bucket",
+            Prefix="test-atlas/source-datasets/",
+            MaxKeys=1
+        )
+        sync._s3_client.get_bucket_location.assert_not_called()
+        sync._s3_client.head_bucket.assert_not_called()
+    
+    def test_sync_reports_missing_credentials(self, sync_config, tmp_path):
+        """Test that missing credentials are reported apart from access denied."""
+        sync = SmartSync(sync_config)
+        sync._s3_client = Mock()
+        sync._s3_client.exceptions.NoSuchBucket = type('NoSuchBucket', (ClientError,), {})
+        sync._s3_client.exceptions.ClientError = ClientError
+        sync._s3_client.list_objects_v2.side_effect = NoCredentialsError()
+        
+        result = sync.sync(tmp_path, "s3://test-bucket/path/")
+        
+        assert result['error'] == 'no_credentials'
+    
+    def test_reset_aws_clients(self, sync_config):
         """Test resetting AWS clients."""
-        sync = SmartSync(self.config)
+        sync = SmartSync(sync_config)
         
         # Set a mock client
         sync._s3_client = Mock()
@@ -118,26 +295,47 @@ class TestSmartSync:
         # Reset should clear the client
         sync._reset_aws_clients()
         assert sync._s3_client is None
-
-    def test_build_s3_url_basic(self):
-        """Test basic S3 URL construction."""
-        sync = SmartSync(self.config)
+    
+    def test_reset_aws_clients_keeps_pool_when_config_unchanged(self, mock_session, sync_config):
+        """Test that a reset only rebuilds clients when their settings changed."""
+        sync = SmartSync(sync_config.model_copy(deep=True))
+        client = sync.s3_client
         
-        file_info = {
-            'filename': 'test.h5ad',
-            'local_path': Path('/tmp/test.h5ad'),
-            'size': 1024,
-            'checksum': 'abc123',
-            'modified': '2023-01-01T00:00:00Z'
-        }
+        # Same profile/region: the client and its connection pool are kept
+        sync._reset_aws_clients()
+        assert sync.s3_client is client
         
-        s3_url = sync._build_s3_url(file_info, "s3://my-bucket/path/to/folder")
+        # Changed region: the client is rebuilt on next access
+        sync.config.aws.region = "eu-west-1"
+        sync._reset_aws_clients()
+        assert sync._s3_client is None
+        sync.s3_client
+        assert mock_session.return_value.client.call_args[1]['region_name'] == "eu-west-1"
+    
+    @patch('hca_smart_sync.sync_engine.create_transfer_manager')
+    def test_reset_aws_clients_rebuilds_transfer_manager(self, mock_create, mock_session, sync_config):
+        """Test that a reset picks up new multipart settings even when clients are kept."""
+        sync = SmartSync(sync_config.model_copy(deep=True))
+        client = sync.s3_client
+        manager = sync.transfer_manager
+        
+        sync.config.s3.multipart_chunksize = 32 * 1024 * 1024
+        sync._reset_aws_clients()
+        
+        manager.shutdown.assert_called_once()
+        assert sync.s3_client is client
+        sync.transfer_manager
+        assert mock_create.call_args[0][1].multipart_chunksize == 32 * 1024 * 1024
+
+    def test_build_s3_url_basic(self, sync, local_file):
+        """Test basic S3 URL construction."""
+        s3_url = sync._build_s3_url(local_file(), "s3://my-bucket/path/to/folder")
         assert s3_url == "s3://my-bucket/path/to/folder/test.h5ad"
     
     @patch('shutil.which')
-    def test_detect_upload_tool_s5cmd_available(self, mock_which):
+    def test_detect_upload_tool_s5cmd_available(self, mock_which, sync_config):
         """Test upload tool detection when s5cmd is available."""
-        sync = SmartSync(self.config)
+        sync = SmartSync(sync_config)
         
         # Mock s5cmd being available
         def which_side_effect(tool):
@@ -151,32 +349,28 @@ class TestSmartSync:
         # Verify s5cmd was checked first
         mock_which.assert_any_call("s5cmd")
     
+    @pytest.mark.parametrize("aws_path", ["/usr/local/bin/aws", None], ids=["with_aws_cli", "without_aws_cli"])
     @patch('shutil.which')
-    def test_detect_upload_tool_aws_cli_fallback(self, mock_which):
-        """Test upload tool detection falls back to AWS CLI when s5cmd is not available."""
-        sync = SmartSync(self.config)
+    def test_detect_upload_tool_falls_back_to_boto3(self, mock_which, sync_config, aws_path):
+        """Test upload tool detection falls back to boto3 whether or not the AWS CLI is installed."""
+        sync = SmartSync(sync_config)
         
-        # Mock s5cmd not available, but AWS CLI is
+        # Mock s5cmd not available
         def which_side_effect(tool):
-            if tool == "s5cmd":
-                return None
-            elif tool == "aws":
-                return "/usr/local/bin/aws"
-            return None
+            return aws_path if tool == "aws" else None
         
         mock_which.side_effect = which_side_effect
         
         tool = sync._detect_upload_tool()
-        assert tool == "aws"
+        assert tool == "boto3"
         
-        # Verify both tools were checked
-        mock_which.assert_any_call("s5cmd")
-        mock_which.assert_any_call("aws")
+        # Uploads run in-process, so the AWS CLI is never looked up
+        mock_which.assert_called_once_with("s5cmd")
     
     @patch('shutil.which')
-    def test_detect_upload_tool_both_available_prefers_s5cmd(self, mock_which):
+    def test_detect_upload_tool_both_available_prefers_s5cmd(self, mock_which, sync_config):
         """Test upload tool detection prefers s5cmd when both tools are available."""
-        sync = SmartSync(self.config)
+        sync = SmartSync(sync_config)
         
         # Mock both tools being available
         def which_side_effect(tool):
@@ -194,327 +388,189 @@ class TestSmartSync:
         # Should only check s5cmd since it's found first
         mock_which.assert_called_once_with("s5cmd")
     
-    @patch('shutil.which')
-    def test_detect_upload_tool_neither_available_raises_error(self, mock_which):
-        """Test upload tool detection raises error when neither tool is available."""
-        sync = SmartSync(self.config)
-        
-        # Mock neither tool being available
-        mock_which.return_value = None
-        
-        with pytest.raises(RuntimeError) as exc_info:
-            sync._detect_upload_tool()
+    @patch('shutil.which', return_value="/usr/local/bin/s5cmd")
+    def test_detect_upload_tool_is_memoized(self, mock_which, sync_config):
+        """Test that PATH is searched once per engine, not once per upload."""
+        sync = SmartSync(sync_config)
         
-        assert "Neither s5cmd nor AWS CLI found" in str(exc_info.value)
-        assert "Please install AWS CLI or s5cmd" in str(exc_info.value)
-        
-        # Verify both tools were checked
-        mock_which.assert_any_call("s5cmd")
-        mock_which.assert_any_call("aws")
+        assert [sync._detect_upload_tool() for _ in range(3)] == ["s5cmd"] * 3
+        mock_which.assert_called_once_with("s5cmd")
 
-    @patch('boto3.Session')
-    def test_compare_with_s3_missing_files(self, mock_session):
-        """Test S3 comparison when files don't exist in S3 (404/NoSuchKey)."""
-        # Mock S3 client that raises NoSuchKey for head_object calls
+    @pytest.mark.parametrize("listed_size,head_result,expected_reason,head_calls", [
+        # Not in the listing: new without a head_object round trip
+        pytest.param(None, None, "new", 0, id="missing"),
+        # Listed, but deleted before the head_object call
+        pytest.param(
+            1024,
+            NO_SUCH_KEY_ERROR,
+            "new", 1, id="nosuchkey_after_listing",
+        ),
+        pytest.param(
+            1024,
+            NOT_FOUND_ERROR,
+            "new", 1, id="404_after_listing",
+        ),
+        # Interrupted upload: the listed size already differs
+        pytest.param(512, None, "changed", 0, id="interrupted"),
+        pytest.param(
+            1024, {'ContentLength': 1024, 'Metadata': {'source-sha256': 'abc123'}},
+            None, 1, id="complete",
+        ),
+        pytest.param(1024, {'ContentLength': 1024, 'Metadata': {}}, "changed", 1, id="missing_metadata"),
+        pytest.param(
+            1024, {'ContentLength': 1024, 'Metadata': {'source-sha256': 'other'}},
+            "changed", 1, id="checksum_mismatch",
+        ),
+    ])
+    def test_compare_with_s3(self, mock_session, sync_config, local_file, listed_size, head_result, expected_reason, head_calls):
+        """Test how listing and head_object results decide whether a file is uploaded."""
         mock_s3_client = Mock()
         mock_session.return_value.client.return_value = mock_s3_client
-        
-        # Configure head_object to raise NoSuchKey exception
-        from botocore.exceptions import ClientError
         mock_s3_client.exceptions.NoSuchKey = ClientError
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response={'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}},
-            operation_name='HeadObject'
-        )
         
-        sync = SmartSync(self.config)
-        
-        # Create mock local files
-        local_files = [
-            {
-                'filename': 'test1.h5ad',
-                'local_path': Path('/tmp/test1.h5ad'),
-                'size': 1024,
-                'checksum': 'abc123',
-                'modified': '2023-01-01T00:00:00Z'
-            },
-            {
-                'filename': 'test2.h5ad', 
-                'local_path': Path('/tmp/test2.h5ad'),
-                'size': 2048,
-                'checksum': 'def456',
-                'modified': '2023-01-01T00:00:00Z'
-            }
-        ]
-        
-        # Test comparison with missing S3 files
-        files_to_upload = sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
-        
-        # All files should be marked for upload as "new"
-        assert len(files_to_upload) == 2
-        assert files_to_upload[0]['filename'] == 'test1.h5ad'
-        assert files_to_upload[0]['reason'] == 'new'
-        assert files_to_upload[1]['filename'] == 'test2.h5ad'
-        assert files_to_upload[1]['reason'] == 'new'
-        
-        # Verify head_object was called for each file
-        assert mock_s3_client.head_object.call_count == 2
+        if isinstance(head_result, Exception):
+            mock_s3_client.head_object.side_effect = head_result
+        else:
+            mock_s3_client.head_object.return_value = head_result
+        mock_listing(mock_s3_client, {} if listed_size is None else {'test.h5ad': listed_size})
+        
+        sync = SmartSync(sync_config)
+        files_to_upload = sync._compare_with_s3([local_file()], "s3://test-bucket/path/", force=False)
+        
+        if expected_reason is None:
+            assert files_to_upload == []
+        else:
+            assert [(f['filename'], f['reason']) for f in files_to_upload] == [('test.h5ad', expected_reason)]
+        assert mock_s3_client.head_object.call_count == head_calls
+        mock_s3_client.get_paginator.assert_called_once_with('list_objects_v2')
 
-    @patch('boto3.Session')
-    def test_compare_with_s3_404_client_error(self, mock_session):
-        """Test S3 comparison when files return 404 ClientError."""
-        # Mock S3 client that raises 404 ClientError for head_object calls
-        mock_s3_client = Mock()
-        mock_session.return_value.client.return_value = mock_s3_client
-        
-        # Configure head_object to raise 404 ClientError (different from NoSuchKey)
-        from botocore.exceptions import ClientError
-        mock_s3_client.exceptions.NoSuchKey = ClientError
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response={'Error': {'Code': '404', 'Message': 'Not Found'}},
-            operation_name='HeadObject'
-        )
-        
-        sync = SmartSync(self.config)
-        
-        # Create mock local file
-        local_files = [
-            {
-                'filename': 'missing.h5ad',
-                'local_path': Path('/tmp/missing.h5ad'),
-                'size': 1024,
-                'checksum': 'xyz789',
-                'modified': '2023-01-01T00:00:00Z'
-            }
-        ]
-        
-        # Test comparison with 404 error
-        files_to_upload = sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
-        
-        # File should be marked for upload as "new" (404 should be treated as missing)
-        assert len(files_to_upload) == 1
-        assert files_to_upload[0]['filename'] == 'missing.h5ad'
-        assert files_to_upload[0]['reason'] == 'new'
-        
-        # Verify head_object was called
-        mock_s3_client.head_object.assert_called_once()
+    def test_sync_lists_remote_while_scanning(self, sync_config, local_file, tmp_path):
+        """Test that sync overlaps the S3 listing with the local scan and reuses it."""
+        sync = SmartSync(sync_config)
+        remote_files = {'test.h5ad': {'key': 'path/test.h5ad', 'size': 1024}}
+        
+        with patch.object(sync, '_validate_s3_access', return_value=True), \
+             patch.object(sync, '_scan_local_files', return_value=[local_file()]), \
+             patch.object(sync, '_scan_remote_files', return_value=remote_files) as mock_remote, \
+             patch.object(sync, '_compare_with_s3', return_value=[]) as mock_compare:
+            result = sync.sync(tmp_path, "s3://test-bucket/path/")
+        
+        assert result['all_up_to_date'] is True
+        mock_remote.assert_called_once_with("s3://test-bucket/path/")
+        assert mock_compare.call_args[1]['remote_files'] is remote_files
+    
+    def test_sync_plan_is_in_natural_order(self, sync_config, tmp_path):
+        """Test that the upload plan keeps the scan's natural order without re-sorting."""
+        for name in ['file10.h5ad', 'file2.h5ad', 'file1.h5ad']:
+            (tmp_path / name).write_bytes(name.encode())
+        sync = SmartSync(sync_config)
+        
+        with patch.object(sync, '_validate_s3_access', return_value=True), \
+             patch.object(sync, '_scan_remote_files', return_value={}), \
+             patch('hca_smart_sync.sync_engine.natsorted', wraps=natsorted) as mock_natsorted:
+            result = sync.sync(tmp_path, "s3://test-bucket/path/", dry_run=True)
+        
+        planned = [f['filename'] for f in result['files_to_upload']]
+        assert planned == ['file1.h5ad', 'file2.h5ad', 'file10.h5ad']
+        mock_natsorted.assert_called_once()
+    
+    @patch('hca_smart_sync.sync_engine.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    def test_compare_with_s3_checks_metadata_concurrently(self, mock_executor, sync_config, local_file):
+        """Test that head_object checks share a thread pool and keep plan order."""
+        sync = SmartSync(sync_config)
+        sync._s3_client = Mock()
+        # Modeled exception class, so other ClientErrors are not caught as NoSuchKey
+        sync._s3_client.exceptions.NoSuchKey = type('NoSuchKey', (ClientError,), {})
+        local_files = [local_file(f'file{i}.h5ad', checksum=f'sha{i}') for i in range(8)]
+        mock_listing(sync._s3_client, {f['filename']: f['size'] for f in local_files})
 
+        def head_object(Bucket, Key):
+            # Even-numbered files are already uploaded with matching metadata
+            i = int(Key[len('path/file'):-len('.h5ad')])
+            checksum = f'sha{i}' if i % 2 == 0 else 'stale'
+            return {'ContentLength': 1024, 'Metadata': {'source-sha256': checksum}}
+        sync._s3_client.head_object.side_effect = head_object
 
-    @patch('boto3.Session')
-    def test_compare_with_s3_interrupted_upload_detection(self, mock_session):
-        """Test that interrupted uploads are detected and marked for re-upload."""
-        # Mock S3 client to simulate an interrupted upload scenario
-        mock_s3_client = Mock()
-        mock_session.return_value.client.return_value = mock_s3_client
-        
-        # Simulate S3 object with correct metadata but wrong size (interrupted upload)
-        mock_response = {
-            'ContentLength': 512,  # S3 shows smaller size (interrupted)
-            'Metadata': {
-                'source-sha256': 'abc123'  # Metadata was set before interruption
-            }
-        }
-        mock_s3_client.head_object.return_value = mock_response
-        
-        local_files = [
-            {
-                'filename': 'interrupted.h5ad',
-                'local_path': Path('/tmp/interrupted.h5ad'),
-                'size': 1024,  # Local file is larger than S3 object
-                'checksum': 'abc123',  # Same checksum as S3 metadata
-                'modified': '2023-01-01T00:00:00Z'
-            }
-        ]
-        
-        # Create sync engine with mocked S3 client
-        sync = SmartSync(self.config)
-        
-        # Test comparison - should detect size mismatch and mark for upload
         files_to_upload = sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
-        
-        # File should be marked for upload due to size mismatch
-        assert len(files_to_upload) == 1
-        assert files_to_upload[0]['filename'] == 'interrupted.h5ad'
-        assert files_to_upload[0]['reason'] == 'changed'
-        
-        # Verify head_object was called
-        assert mock_s3_client.head_object.call_count == 1
 
-    @patch('boto3.Session')
-    def test_compare_with_s3_complete_upload_detection(self, mock_session):
-        """Test that complete uploads with matching size and checksum are skipped."""
-        # Mock S3 client to simulate a complete, valid upload
-        mock_s3_client = Mock()
-        mock_session.return_value.client.return_value = mock_s3_client
-        
-        # Simulate S3 object with correct metadata AND correct size
-        mock_response = {
-            'ContentLength': 1024,  # Matches local file size
-            'Metadata': {
-                'source-sha256': 'abc123'  # Matches local file checksum
-            }
-        }
-        mock_s3_client.head_object.return_value = mock_response
-        
-        local_files = [
-            {
-                'filename': 'complete.h5ad',
-                'local_path': Path('/tmp/complete.h5ad'),
-                'size': 1024,  # Same size as S3 object
-                'checksum': 'abc123',  # Same checksum as S3 metadata
-                'modified': '2023-01-01T00:00:00Z'
-            }
-        ]
-        
-        # Create sync engine with mocked S3 client
-        sync = SmartSync(self.config)
-        
-        # Test comparison - should skip file as it's complete and identical
-        files_to_upload = sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
-        
-        # No files should be marked for upload
-        assert len(files_to_upload) == 0
-        
-        # Verify head_object was called
-        assert mock_s3_client.head_object.call_count == 1
+        assert [f['filename'] for f in files_to_upload] == [f'file{i}.h5ad' for i in (1, 3, 5, 7)]
+        assert sync._s3_client.head_object.call_count == 8
+        mock_executor.assert_called_once_with(max_workers=8)
 
-    @patch('boto3.Session')
-    def test_compare_with_s3_missing_metadata_detection(self, mock_session):
-        """Test that files with missing source-sha256 metadata are marked for re-upload."""
-        # Mock S3 client to simulate an object without our metadata
-        mock_s3_client = Mock()
-        mock_session.return_value.client.return_value = mock_s3_client
-        
-        # Simulate S3 object with correct size but missing metadata
-        mock_response = {
-            'ContentLength': 1024,  # Correct size
-            'Metadata': {}  # No source-sha256 metadata
-        }
-        mock_s3_client.head_object.return_value = mock_response
-        
-        local_files = [
-            {
-                'filename': 'no_metadata.h5ad',
-                'local_path': Path('/tmp/no_metadata.h5ad'),
-                'size': 1024,
-                'checksum': 'abc123',
-                'modified': '2023-01-01T00:00:00Z'
-            }
-        ]
-        
-        # Create sync engine with mocked S3 client
-        sync = SmartSync(self.config)
-        
-        # Test comparison - should mark for upload due to missing metadata
-        files_to_upload = sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
+        # Unexpected errors still fail the comparison
+        sync._s3_client.head_object.side_effect = ACCESS_DENIED_ERROR
+        with pytest.raises(RuntimeError, match="AccessDenied"):
+            sync._compare_with_s3(local_files, "s3://test-bucket/path/", force=False)
+
+    def test_scan_remote_files_uses_paginator(self, sync_config):
+        """Test remote listing with a stubbed list_objects_v2 paginator."""
+        sync = SmartSync(sync_config)
+        sync._s3_client = boto3.client(
+            's3',
+            region_name='us-east-1',
+            aws_access_key_id='testing',
+            aws_secret_access_key='testing'
+        )
         
-        # File should be marked for upload due to missing metadata
-        assert len(files_to_upload) == 1
-        assert files_to_upload[0]['filename'] == 'no_metadata.h5ad'
-        assert files_to_upload[0]['reason'] == 'changed'
+        expected_params = {'Bucket': 'test-bucket', 'Prefix': 'path/', 'Delimiter': '/', 'MaxKeys': 1000}
+        with Stubber(sync._s3_client) as stubber:
+            stubber.add_response(
+                'list_objects_v2',
+                {
+                    'Contents': [
+                        {'Key': 'path/file1.h5ad', 'Size': 11, 'ETag': '"a"'},
+                        {'Key': 'path/file2.h5ad', 'Size': 22, 'ETag': '"b"'},
+                    ],
+                    'IsTruncated': True,
+                    'NextContinuationToken': 'token',
+                },
+                expected_params
+            )
+            stubber.add_response(
+                'list_objects_v2',
+                {'Contents': [{'Key': 'path/file10.h5ad', 'Size': 33, 'ETag': '"c"'}], 'IsTruncated': False},
+                {**expected_params, 'ContinuationToken': 'token'}
+            )
+            
+            remote_files = sync._scan_remote_files("s3://test-bucket/path/")
+            stubber.assert_no_pending_responses()
         
-        # Verify head_object was called
-        assert mock_s3_client.head_object.call_count == 1
+        assert set(remote_files) == {'file1.h5ad', 'file2.h5ad', 'file10.h5ad'}
+        assert remote_files['file10.h5ad']['key'] == 'path/file10.h5ad'
+        assert remote_files['file2.h5ad']['size'] == 22
 
 class TestSubprocessErrorHandling:
-    """Test enhanced subprocess error handling in sync engine."""
+    """Test upload and error handling in sync engine."""
     
-    def setup_method(self):
-        """Set up test configuration."""
-        self.config = Config(
-            aws=AWSConfig(
-                profile="test-profile",
-                region="us-east-1"
-            ),
-            s3=S3Config(
-                bucket="test-bucket",
-                prefix="test-atlas/source-datasets"
-            ),
-            manifest=ManifestConfig(
-                filename_template="manifest-{timestamp}.json"
-            )
-        )
-    
-    @patch('subprocess.run')
-    def test_run_aws_cli_command_error_with_stderr(self, mock_run):
-        """Test that AWS CLI command errors with stderr are properly captured and re-raised."""
-        # Mock a CalledProcessError with stderr output
-        error = subprocess.CalledProcessError(
-            returncode=1,
-            cmd=['aws', 's3', 'cp', 'test.h5ad', 's3://bucket/path/'],
-            output="some stdout",
-            stderr="AccessDenied: Access denied to S3 bucket"
-        )
-        mock_run.side_effect = error
-        
-        # Create mock console to capture output
-        mock_console = Mock()
-        sync = SmartSync(self.config, console=mock_console)
-        
-        cmd = ['aws', 's3', 'cp', 'test.h5ad', 's3://bucket/path/']
+    @patch('hca_smart_sync.checksum.ChecksumCalculator.calculate_sha256')
+    @pytest.mark.usefixtures("upload_tool")
+    def test_upload_file_boto3_error_is_reported(self, mock_calculate_sha256, sync_config):
+        """Test that boto3 upload errors are printed and reported as a failed upload."""
+        mock_calculate_sha256.return_value = 'abc123'
         
-        # Should re-raise CalledProcessError (not RuntimeError)
-        with pytest.raises(subprocess.CalledProcessError) as exc_info:
-            sync._run_aws_cli_command(cmd, "upload test.h5ad")
+        mock_console = Mock(spec=['print'])
+        sync = SmartSync(sync_config, console=mock_console)
+        sync._transfer_manager = Mock()
+        sync._transfer_manager.upload.return_value.result.side_effect = ACCESS_DENIED_ERROR
         
-        # Verify the re-raised exception has enhanced error message
-        raised_exception = exc_info.value
-        assert raised_exception.returncode == 1
-        assert "Failed to upload test.h5ad" in raised_exception.stderr
-        assert "AWS CLI Error: AccessDenied: Access denied to S3 bucket" in raised_exception.stderr
-        assert "Exit code: 1" in raised_exception.stderr
+        result = sync._upload_file('/path/test.h5ad', "s3://bucket/path/test.h5ad", file_size=1024)
         
-        # Verify console output was called with error message
-        mock_console.print.assert_called()
+        assert result is False
         console_call_args = mock_console.print.call_args[0][0]
         assert "[red]❌" in console_call_args
         assert "Failed to upload test.h5ad" in console_call_args
+        assert "AccessDenied" in console_call_args
     
-    @patch('subprocess.run')
-    def test_run_aws_cli_command_success_with_stderr_capture(self, mock_run):
-        """Test that successful AWS CLI commands work with stderr capture only."""
-        # Mock successful subprocess run
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        
-        mock_console = Mock()
-        sync = SmartSync(self.config, console=mock_console)
-        
-        cmd = ['aws', 's3', 'cp', 'test.h5ad', 's3://bucket/path/']
-        
-        # Should complete successfully
-        sync._run_aws_cli_command(cmd, "upload test.h5ad")
-        
-        # Verify subprocess.run was called with stderr=PIPE only
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        assert call_args[1]['stderr'] == subprocess.PIPE
-        assert call_args[1]['text'] is True
-        assert call_args[1]['check'] is True
-        # stdout should NOT be captured (not in call_args)
-        assert 'stdout' not in call_args[1] or call_args[1].get('stdout') is None
-    
-    @patch('pathlib.Path.stat')
     @patch('hca_smart_sync.checksum.ChecksumCalculator.calculate_sha256')
-    @patch('subprocess.run')
-    def test_upload_files_uses_reusable_method(self, mock_run, mock_calculate_sha256, mock_stat):
-        """Test that _upload_file uses the unified upload method."""
-        # Mock file system operations
-        mock_stat.return_value.st_size = 1024 * 1024
-        
+    @pytest.mark.usefixtures("upload_tool")
+    def test_upload_files_uses_reusable_method(self, mock_calculate_sha256, sync_config):
+        """Test that _upload_file uploads through the shared boto3 transfer manager."""
         # Mock checksum calculation
         mock_calculate_sha256.return_value = 'abc123'
         
-        # Mock successful subprocess run
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        
-        mock_console = Mock()
-        sync = SmartSync(self.config, console=mock_console)
+        mock_console = Mock(spec=['print'])
+        sync = SmartSync(sync_config, console=mock_console)
+        sync._transfer_manager = Mock()
         
         # Test the unified upload method directly
         file_path = '/path/test.h5ad'
@@ -523,64 +579,142 @@ class TestSubprocessErrorHandling:
         # Should complete successfully
         result = sync._upload_file(file_path, s3_url, include_checksum=True, file_size=1024*1024)
         
-        # Verify subprocess.run was called once (by the unified method)
-        mock_run.assert_called_once()
+        # Verify upload was called once with the parsed bucket/key and checksum metadata
+        sync._transfer_manager.upload.assert_called_once()
+        args, kwargs = sync._transfer_manager.upload.call_args
+        assert args == (file_path, "test-bucket", "test-atlas/source-datasets/test.h5ad")
+        assert kwargs['extra_args'] == {"Metadata": {"source-sha256": "abc123"}}
         
         # Verify upload was successful
         assert result is True
+        assert "Successfully uploaded: test.h5ad" in mock_console.print.call_args_list[0][0][0]
     
-    @patch('subprocess.run')
-    def test_manifest_upload_uses_reusable_method(self, mock_run):
-        """Test that manifest upload uses the new unified _upload_file method."""
-        # Mock successful subprocess run
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        
-        mock_console = Mock()
-        sync = SmartSync(self.config, console=mock_console)
-        
-        # Create a temporary manifest file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"test": "manifest"}')
-            manifest_path = f.name
-        
-        try:
-            sync._upload_manifest_to_s3(
-                manifest_path, 
-                "s3://test-bucket/test-atlas/manifests/"
-            )
-            
-            # Verify subprocess.run was called once (by the unified upload method)
-            mock_run.assert_called_once()
-            
-            # Verify the manifest file path is in the command
-            call_args = mock_run.call_args[0][0]  # First positional arg (cmd)
-            assert manifest_path in call_args
-            assert 'manifests' in ' '.join(call_args)
-            
-        finally:
-            # Clean up temp file
-            Path(manifest_path).unlink(missing_ok=True)
-
-
-class TestTransferAcceleration:
-    """Test Transfer Acceleration command generation."""
+    @patch('hca_smart_sync.checksum.ChecksumCalculator.calculate_sha256')
+    @pytest.mark.usefixtures("upload_tool")
+    def test_upload_file_reuses_precomputed_checksum(self, mock_calculate_sha256, sync_config):
+        """Test that a checksum from the scan is sent as metadata without rehashing."""
+        sync = SmartSync(sync_config, console=Mock(spec=['print']))
+        sync._transfer_manager = Mock()
+        
+        result = sync._upload_file(
+            '/path/test.h5ad',
+            "s3://test-bucket/path/test.h5ad",
+            file_size=1024,
+            checksum='precomputed'
+        )
+        
+        assert result is True
+        mock_calculate_sha256.assert_not_called()
+        kwargs = sync._transfer_manager.upload.call_args[1]
+        assert kwargs['extra_args'] == {"Metadata": {"source-sha256": "precomputed"}}
     
-    def setup_method(self):
-        """Set up test configuration."""
-        self.config = Config(
-            aws=AWSConfig(
-                profile="test-profile",
-                region="us-east-1"
-            ),
-            s3=S3Config(
-                bucket="test-bucket",
-                prefix="test-atlas/source-datasets"
-            ),
-            manifest=ManifestConfig(
-                filename_template="manifest-{timestamp}.json"
-            )
+    @patch('hca_smart_sync.sync_engine.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    @pytest.mark.usefixtures("upload_tool")
+    def test_upload_files_parallel(self, mock_executor, sync_config, local_file):
+        """Test that boto3 uploads share a thread pool and keep plan order."""
+        sync = SmartSync(sync_config, console=Mock(spec=['print']))
+        sync._transfer_manager = Mock()
+        
+        files = [local_file(f'file{i}.h5ad', checksum=f'sha{i}') for i in range(32)]
+        
+        uploaded = sync._upload_files(files, "s3://test-bucket/path/")
+        
+        assert uploaded == files
+        assert sync._transfer_manager.upload.call_count == 32
+        mock_executor.assert_called_once_with(max_workers=sync_config.s3.upload_workers)
+    
+    @patch('hca_smart_sync.sync_engine.ThreadPoolExecutor')
+    @pytest.mark.parametrize("upload_tool", ["s5cmd"], indirect=True)
+    def test_upload_files_s5cmd_single_batch(self, mock_executor, sync_config, local_file, upload_tool, monkeypatch):
+        """Test that s5cmd uploads go through one ``s5cmd run`` and drop failed files."""
+        sync = SmartSync(sync_config, console=Mock(spec=['print']))
+        files = [local_file(name, checksum=f'sha-{name}') for name in ('a.h5ad', 'b.h5ad')]
+        
+        success = json.dumps({
+            'operation': 'cp', 'success': True,
+            'source': '/tmp/a.h5ad', 'destination': 's3://test-bucket/path/a.h5ad'
+        })
+        fake_run = Mock(return_value=SimpleNamespace(returncode=1, stdout=success + "\n", stderr="b.h5ad failed"))
+        monkeypatch.setattr("hca_smart_sync.sync_engine.subprocess.run", fake_run)
+        
+        uploaded = sync._upload_files(files, "s3://test-bucket/path/")
+        
+        assert uploaded == files[:1]
+        fake_run.assert_called_once()
+        cmd = fake_run.call_args[0][0]
+        assert cmd[:2] == ["s5cmd", "--json"]
+        assert cmd[-1] == "run"
+        assert fake_run.call_args[1]['input'].splitlines() == [
+            "cp --metadata source-sha256=sha-a.h5ad /tmp/a.h5ad s3://test-bucket/path/a.h5ad",
+            "cp --metadata source-sha256=sha-b.h5ad /tmp/b.h5ad s3://test-bucket/path/b.h5ad",
+        ]
+        mock_executor.assert_not_called()
+    
+    @pytest.mark.parametrize("upload_tool", ["boto3", "s5cmd"], indirect=True)
+    def test_manifest_upload_uses_transfer_manager(self, sync_config, tmp_path, upload_tool, monkeypatch):
+        """Test that the manifest is uploaded in-process whichever tool handles data files."""
+        fake_run = Mock()
+        monkeypatch.setattr("hca_smart_sync.sync_engine.subprocess.run", fake_run)
+        mock_console = Mock(spec=['print'])
+        sync = SmartSync(sync_config, console=mock_console)
+        sync._transfer_manager = Mock()
+        
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text('{"test": "manifest"}')
+        manifest_path = str(manifest_file)
+        
+        sync._upload_manifest_to_s3(
+            manifest_path, 
+            "s3://test-bucket/test-atlas/manifests/"
         )
-    
\ No newline at end of file
+        
+        # Verify upload went through the transfer manager, never a subprocess
+        sync._transfer_manager.upload.assert_called_once()
+        fake_run.assert_not_called()
+        
+        # Verify the manifest file is uploaded under manifests/ without checksum metadata
+        args, kwargs = sync._transfer_manager.upload.call_args
+        assert args[0] == manifest_path
+        assert args[1] == "test-bucket"
+        assert args[2].startswith("test-atlas/manifests/")
+        assert kwargs['extra_args'] is None
+    
+    @patch('hca_smart_sync.sync_engine.create_transfer_manager')
+    @pytest.mark.usefixtures("upload_tool")
+    def test_transfer_manager_created_once(self, mock_create, sync_config):
+        """Test that one tuned transfer manager serves every upload."""
+        sync = SmartSync(sync_config, console=Mock(spec=['print']))
+        sync._transfer_client = Mock()
+        
+        for name in ('a.h5ad', 'b.h5ad', 'c.h5ad'):
+            sync._upload_file(f'/tmp/{name}', f"s3://test-bucket/path/{name}", file_size=1, checksum='abc')
+        
+        mock_create.assert_called_once()
+        client, transfer_config = mock_create.call_args[0]
+        assert client is sync._transfer_client
+        assert transfer_config.multipart_threshold == sync_config.s3.multipart_threshold
+        assert transfer_config.multipart_chunksize == sync_config.s3.multipart_chunksize
+        assert transfer_config.max_concurrency == sync_config.s3.max_concurrency
+        assert mock_create.return_value.upload.call_count == 3
+    
+    def test_transfer_client_uses_accelerate_endpoint(self, mock_session, sync_config):
+        """Test that uploads use a separate accelerate-endpoint client when enabled."""
+        sync = SmartSync(sync_config)
+        
+        client = sync.transfer_client
+        
+        assert client is sync.transfer_client
+        boto_config = mock_session.return_value.client.call_args[1]['config']
+        assert boto_config.s3 == {"use_accelerate_endpoint": True}
+        assert boto_config.max_pool_connections == CLIENT_CONFIG.max_pool_connections
+        assert boto_config.retries == {"max_attempts": 10, "mode": "adaptive"}
+    
+    def test_transfer_client_without_acceleration_reuses_s3_client(self, mock_session, sync_config):
+        """Test that the regular client is reused when acceleration is disabled."""
+        config = sync_config.model_copy(
+            update={"s3": sync_config.s3.model_copy(update={"use_transfer_acceleration": False})}
+        )
+        sync = SmartSync(config)
+        
+        assert sync.transfer_client is sync.s3_client
+        mock_session.assert_called_once()